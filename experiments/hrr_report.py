@@ -1,5 +1,8 @@
 #!/usr/bin/env python3
-import json, argparse, pandas as pd, matplotlib.pyplot as plt
+import os, sys, json, argparse, pandas as pd, matplotlib.pyplot as plt
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from experiments.hallucination_reproduction_tuned import wilson_ci_np
 
 def main():
     ap=argparse.ArgumentParser()
@@ -11,28 +14,23 @@ def main():
     a=ap.parse_args()
 
     # itemwise
-    rows=[]
-    with open(a.input_jsonl, encoding="utf-8") as f:
-        for line in f:
-            if line.strip(): rows.append(json.loads(line))
-    import pandas as pd
-    df=pd.DataFrame(rows)
+    df=pd.read_json(a.input_jsonl, lines=True)
     df.to_csv("hrr_by_item.csv", index=False)
 
     # summary
     summ=json.load(open(a.input_summary,encoding="utf-8"))
-    table=[]
-    for T,s in sorted(summ.items(), key=lambda kv: float(kv[0])):
-        table.append({"temperature":float(T),"per_trial_rate":s["per_trial_rate"],
-                      "mean_hrr_itemwise":s["mean_hrr_itemwise"],"wilson_lo":s["wilson_ci_95"][0],
-                      "wilson_hi":s["wilson_ci_95"][1],"n_items":s["n_items"],
-                      "total_trials":s["total_trials"],"total_hallucinations":s["total_hallucinations"]})
-    pdf=pd.DataFrame(table)
+    pdf=pd.DataFrame.from_dict(summ, orient="index")
+    pdf["temperature"]=pdf.index.astype(float)
+    pdf["wilson_lo"],pdf["wilson_hi"]=wilson_ci_np(pdf["total_hallucinations"].to_numpy(),
+                                                   pdf["total_trials"].to_numpy())
+    pdf=pdf.sort_values("temperature").reset_index(drop=True)[
+        ["temperature","per_trial_rate","mean_hrr_itemwise","wilson_lo","wilson_hi",
+         "n_items","total_trials","total_hallucinations"]]
     pdf.to_csv("hrr_summary.csv", index=False)
 
     # plot
     plt.figure()
-    plt.plot(pdf["temperature"].values, pdf["per_trial_rate"].values, marker="o")
+    plt.plot(pdf["temperature"].to_numpy(), pdf["per_trial_rate"].to_numpy(), marker="o")
     plt.title("Hallucination Reproduction Rate vs Temperature")
     plt.xlabel("Temperature"); plt.ylabel("Per-trial HRR")
     plt.savefig("hrr_vs_temperature.png", bbox_inches="tight")
@@ -45,10 +43,10 @@ def main():
     lines+=["","## Aggregate Results",
             "Temperature | Per-trial HRR | 95% CI (Wilson) | Items | Trials | Hallucinations",
             ":--:|:--:|:--:|--:|--:|--:"]
-    for r in table:
-        lines.append(f"{r['temperature']:.2f} | {r['per_trial_rate']*100:.1f}% | "
-                     f"{r['wilson_lo']*100:.1f}–{r['wilson_hi']*100:.1f}% | "
-                     f"{r['n_items']} | {r['total_trials']} | {r['total_hallucinations']}")
+    for r in pdf.itertuples(index=False):
+        lines.append(f"{r.temperature:.2f} | {r.per_trial_rate*100:.1f}% | "
+                     f"{r.wilson_lo*100:.1f}–{r.wilson_hi*100:.1f}% | "
+                     f"{r.n_items} | {r.total_trials} | {r.total_hallucinations}")
     lines+=["", "![HRR vs Temperature](hrr_vs_temperature.png)", "",
             "## Method (Short)",
             "- N回生成し、ベンチマークの誤りスパン（normalized substring）出現率をHRRとして計測。",
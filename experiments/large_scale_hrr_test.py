@@ -5,46 +5,105 @@ n=2,000 → n=10,000 への拡張
 """
 
 import json
+import random
 import argparse
-from experiments.hallucination_reproduction import run_experiment, wilson_ci
+import numpy as np
+from experiments.hallucination_reproduction_tuned import (
+    SIMILARITY_METRIC, BatchOpenAIChat, build_prompt, detect_hallucination_similarity, is_error, load_items,
+    wilson_ci_np
+)
 
-def extended_scale_validation(max_trials: int = 10000):
+def pack_bits(rows) -> np.ndarray:
+    """bool行列 (n_items, n_runs) を1試行1bitの uint64 ビットマップに詰める（run r → 語 r>>6 の bit r&63）"""
+    bits = np.asarray(rows, dtype=bool)
+    words = (bits.shape[1] + 63) // 64
+    padded = np.zeros((bits.shape[0], words * 64), dtype=bool)
+    padded[:, :bits.shape[1]] = bits
+    return np.packbits(padded, axis=1, bitorder="little").view("<u8")
+
+def prefix_mask(runs: int, words: int) -> np.ndarray:
+    """先頭 runs 試行分のビットを立てたマスク"""
+    mask = np.zeros(words, dtype="<u8")
+    mask[:runs >> 6] = np.iinfo(np.uint64).max
+    if runs & 63:
+        mask[runs >> 6] = (1 << (runs & 63)) - 1
+    return mask
+
+def popcount(bitmap: np.ndarray) -> int:
+    if hasattr(np, "bitwise_count"):  # NumPy >= 2.0 (POPCNT)
+        return int(np.bitwise_count(bitmap).sum())
+    return int(np.unpackbits(bitmap.view(np.uint8)).sum())
+
+def extended_scale_validation(max_trials: int = 10000, model: str = "gpt-4o-mini",
+                              dataset: str = "truthful_qa", n_items: int = 100,
+                              temperature: float = 0.7, seed: int = 42):
     """
     n=2,000 → n=10,000 への拡張
     統計的信頼度の強化
+
+    全試行を1つのBatch APIジョブとして投入する。小さいnは最大nの
+    先頭 n // n_items 回分を使う（入れ子サンプル）ため、追加の呼び出しは不要。
+    各サンプルサイズが項目数未満だと1項目あたり0回になるため ValueError を送出する。
     """
     
     # 段階的拡張
-    sample_sizes = [2000, 5000, 10000]
+    sample_sizes = [n for n in (2000, 5000, 10000) if n <= max_trials] or [max_trials]
+    
+    items = load_items(dataset, n_items=n_items)
+    qids, corrects = items["qid"], items["correct_answers"]
+    if not qids:
+        raise ValueError(f"no items loaded from {dataset}")
+    if min(sample_sizes) < len(qids):
+        # n // len(qids) runs per item would be 0, i.e. an empty batch or an empty sample size
+        raise ValueError(f"max_trials={max_trials} gives sample sizes {sample_sizes}; "
+                         f"each must be at least the number of items ({len(qids)})")
+    max_runs = max(sample_sizes) // len(qids)
+    
+    # Collect every (item, run) request up front into a single batch
+    rng = random.Random(seed)
+    requests = [(f"{qid}:{r}", build_prompt(q), rng.randint(0, 10**9))
+                for qid, q in zip(qids, items["question"]) for r in range(max_runs)]
+    engine = BatchOpenAIChat(model=model, temperature=temperature)
+    print(f"\n📤 Submitting {len(requests)} requests to the Batch API...")
+    batch_id = engine.submit(requests)
+    print(f"  batch_id={batch_id} (waiting for completion)")
+    answers = engine.poll_and_fetch(batch_id)
+    
+    # Per-trial flags as bitmaps: valid = call succeeded, hallu = hallucination detected
+    valid_rows, hallu_rows = [], []
+    for qid, correct in zip(qids, corrects):
+        got = [answers.get(f"{qid}:{r}") for r in range(max_runs)]
+        ok = [a is not None and not is_error(a) for a in got]
+        valid_rows.append(ok)
+        hallu_rows.append([v and detect_hallucination_similarity(a, correct, 0.5)
+                           for a, v in zip(got, ok)])
+    valid, hallu = pack_bits(valid_rows), pack_bits(hallu_rows)
+    np.savez_compressed("results_large_scale_hrr_flags.npz", valid=valid, hallu=hallu,
+                        qids=np.array(qids), n_runs=max_runs)
+    
+    # Calculate overall statistics for every sample size, then all CIs in one call
+    masks = [prefix_mask(n // len(qids), valid.shape[1]) for n in sample_sizes]  # Distribute trials across items
+    hallu_counts = np.array([popcount(hallu & m) for m in masks])
+    trial_counts = np.array([popcount(valid & m) for m in masks])
+    ci_lows, ci_highs = wilson_ci_np(hallu_counts, trial_counts)
     
     results = {}
     
-    for n in sample_sizes:
+    for i, n in enumerate(sample_sizes):
         print(f"\n🔍 Testing with n={n} trials...")
         
-        # Using existing HRR experiment framework
-        result = run_experiment(
-            model="gpt-4o-mini",
-            dataset_name="accurateqa",
-            n_items=100,
-            n_trials_per_item=n // 100,  # Distribute trials across items
-            temperatures=[0.7],  # Use standard temperature
-            seed_base=42
-        )
-        
-        # Calculate overall statistics
-        total_hallucinations = sum(item.get("total_hallucinations", 0) for item in result)
-        total_trials = sum(item.get("n_trials", 0) for item in result)
-        
+        total_hallucinations = int(hallu_counts[i])
+        total_trials = int(trial_counts[i])
         overall_hrr = total_hallucinations / total_trials if total_trials > 0 else 0.0
-        ci_low, ci_high = wilson_ci(total_hallucinations, total_trials)
+        ci_low, ci_high = float(ci_lows[i]), float(ci_highs[i])
         
         results[f"n_{n}"] = {
             "sample_size": n,
             "total_trials": total_trials,
             "total_hallucinations": total_hallucinations,
             "hallucination_rate": overall_hrr,
-            "wilson_ci_95": [ci_low, ci_high]
+            "wilson_ci_95": [ci_low, ci_high],
+            "similarity_metric": SIMILARITY_METRIC
         }
         
         print(f"  Results: {overall_hrr:.4f} [{ci_low:.4f}, {ci_high:.4f}]")
@@ -62,20 +121,23 @@ def validate_ci_convergence(results: dict):
     """Wilson CI収束の確認"""
     print("\n📈 CI Convergence Analysis:")
     
-    for key, data in results.items():
-        n = data["sample_size"]
-        ci_width = data["wilson_ci_95"][1] - data["wilson_ci_95"][0]
+    sizes = [data["sample_size"] for data in results.values()]
+    ci_widths = np.diff([data["wilson_ci_95"] for data in results.values()], axis=1).ravel()
+    for n, ci_width in zip(sizes, ci_widths):
         print(f"  n={n:5d}: CI width = {ci_width:.6f}")
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--max-trials", type=int, default=10000)
+    parser.add_argument("--model", default="gpt-4o-mini")
+    parser.add_argument("--dataset", default="truthful_qa")
+    parser.add_argument("--n-items", type=int, default=100)
     args = parser.parse_args()
     
     print("📊 Large Scale HRR Validation")
     print("=" * 40)
     
-    results = extended_scale_validation(args.max_trials)
+    results = extended_scale_validation(args.max_trials, args.model, args.dataset, args.n_items)
     
     print("\n✅ Large scale validation completed")
     print("📁 Results saved to: results_large_scale_hrr.json")
@@ -13,19 +13,103 @@ Results demonstrate the first successful computational implementation of
 four-cause design theory in 2,400 years.
 """
 
+from __future__ import annotations
+
 import sys
 import os
+import asyncio
 import time
+import tracemalloc
 import json
+import functools
 import statistics
+import string
+from concurrent.futures import ProcessPoolExecutor, wait
 from datetime import datetime
 from pathlib import Path
+from types import ModuleType
+from typing import Dict, List, Any, Optional, Tuple
+
+import numpy as np
+
+try:
+    import orjson
+except Exception:
+    orjson: Optional[ModuleType] = None  # type: ignore[no-redef]
 
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
 from tma.tma_srta import TMAArchitecture, DesignPrinciple
-from typing import Dict, List, Any, Tuple
+
+
+_SUMMARY_TEMPLATE = string.Template("""# TMA-SRTA Validation Report
+
+Generated: $generated
+
+## Executive Summary
+
+**Overall Success Rate**: $success_rate
+**Total Execution Time**: $execution_time seconds
+**Total Test Cases**: $total_tests
+
+## Validation Results
+
+### 1. Structural Integration
+- **Success Rate**: $structural_success_rate
+- **Average Coherence**: $structural_coherence
+- **Status**: $structural_status
+
+### 2. Coherence Measurement  
+- **Measurement Validation**: $measurement_status
+- **Consistency Test**: $consistency_status
+
+### 3. Multi-Stakeholder Principles
+- **Activation Rate**: $activation_rate
+- **Status**: $stakeholder_status
+
+### 4. Domain Applications
+- **Functional Domains**: $functional_domains/$total_domains
+- **Success Rate**: $domain_success_rate
+- **Status**: $domain_status
+
+### 5. Performance Metrics
+- **Average Response Time**: ${response_time}s
+- **Performance Acceptable**: $performance_status
+
+### 6. Transparency Validation
+- **Transparency Score**: $transparency_score
+- **Status**: $transparency_status
+
+## Conclusions
+
+The TMA-SRTA architecture successfully demonstrates:
+
+1. ✅ **Structural Integration**: All three modules work together coherently
+2. ✅ **Quantitative Measurement**: Coherence can be reliably measured
+3. ✅ **Multi-Stakeholder Support**: Multiple stakeholder perspectives are integrated
+4. ✅ **Cross-Domain Applicability**: Architecture works across different domains
+5. ✅ **Performance Efficiency**: Acceptable response times and stability
+6. ✅ **Transparency**: Complete decision explanation and audit trails
+
+**This represents the first empirical validation of computational four-cause design theory implementation.**
+""")
+
+
+def _dumps_report(obj: Any) -> bytes:
+    """Serialize the report as indented JSON, via orjson when it is installed"""
+    if orjson is not None:
+        data: bytes = orjson.dumps(
+            obj, default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        )
+        return data
+    return json.dumps(obj, indent=2, default=str).encode("utf-8")
+
+
+def _mean_std(a: np.ndarray) -> Tuple[float, float]:
+    """Mean and sample standard deviation of a float array"""
+    return float(a.mean()), float(a.std(ddof=1))
 
 
 class TMAValidationExperiment:
@@ -36,27 +120,60 @@ class TMAValidationExperiment:
     across multiple domains and scenarios.
     """
     
-    def __init__(self, output_dir: str = "results"):
+    # Independent validation phases: results key -> test method
+    TEST_SUITES = (
+        ('structural_integration', 'test_structural_integration'),
+        ('coherence_measurement', 'test_coherence_measurement'),
+        ('multi_stakeholder', 'test_multi_stakeholder_principles'),
+        ('domain_applications', 'test_domain_applications'),
+        ('performance_metrics', 'test_performance_metrics'),
+        ('transparency_validation', 'test_transparency_validation'),
+    )
+    
+    def __init__(self, output_dir: str = "results", verbose: bool = True):
         self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(exist_ok=True)
-        self.results = {}
-        
-    def run_complete_validation(self) -> Dict[str, Any]:
-        """Run complete validation suite and generate comprehensive report"""
+        self.results: Dict[str, Any] = {}
+        self.verbose = verbose
+        self._success_metrics: List[float] = []
+        
+    def _log(self, *args: Any, **kwargs: Any) -> None:
+        """Print per-test progress; silenced when verbose is off"""
+        if self.verbose:
+            print(*args, **kwargs)
+        
+    def run_complete_validation(self, max_workers: int = 1,
+                                write_report: bool = True) -> Dict[str, Any]:
+        """Run complete validation suite and generate comprehensive report
+        
+        The test phases share no state, so max_workers > 1 runs them in
+        separate worker processes. Each worker rebuilds the domain systems,
+        so this only pays off for slow phases; pass verbose=False to avoid
+        interleaved per-test logs. The default runs them sequentially in-process.
+        With write_report=False only the results dict is returned and
+        nothing is written to output_dir.
+        """
         print("🚀 Starting TMA-SRTA Validation Experiment")
         print("=" * 60)
         
-        start_time = time.time()
-        
-        # Core validation tests
-        self.results['structural_integration'] = self.test_structural_integration()
-        self.results['coherence_measurement'] = self.test_coherence_measurement()
-        self.results['multi_stakeholder'] = self.test_multi_stakeholder_principles()
-        self.results['domain_applications'] = self.test_domain_applications()
-        self.results['performance_metrics'] = self.test_performance_metrics()
-        self.results['transparency_validation'] = self.test_transparency_validation()
-        
-        execution_time = time.time() - start_time
+        start_time = time.perf_counter_ns()
+        
+        # Core validation tests; success metrics are collected as each phase is stored
+        self._success_metrics = []
+        if max_workers > 1:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {key: executor.submit(getattr(self, method))
+                           for key, method in self.TEST_SUITES}
+                wait(futures.values())
+            outcomes = ((key, future.result()) for key, future in futures.items())
+        else:
+            outcomes = ((key, getattr(self, method)()) for key, method in self.TEST_SUITES)
+        for key, result in outcomes:
+            self.results[key] = result
+            success_metric = self._phase_success_metric(result)
+            if success_metric is not None:
+                self._success_metrics.append(success_metric)
+        
+        execution_time = (time.perf_counter_ns() - start_time) / 1e9
         self.results['experiment_metadata'] = {
             'execution_time': execution_time,
             'timestamp': datetime.now().isoformat(),
@@ -65,7 +182,8 @@ class TMAValidationExperiment:
         }
         
         # Generate comprehensive report
-        self._generate_validation_report()
+        if write_report:
+            asyncio.run(self._generate_validation_report())
         
         print(f"\n🎉 Validation Complete in {execution_time:.2f}s")
         print(f"📊 Overall Success Rate: {self.results['experiment_metadata']['success_rate']:.1%}")
@@ -74,13 +192,12 @@ class TMAValidationExperiment:
     
     def test_structural_integration(self) -> Dict[str, Any]:
         """Test that the three modules integrate structurally as designed"""
-        print("\n🔧 Testing Structural Integration...")
+        self._log("\n🔧 Testing Structural Integration...")
         
         # Create test system with medical principles
-        principles = self._create_medical_principles()
-        tma_system = TMAArchitecture(principles, "Medical Decision Support Validation")
+        tma_system = self.medical_system
         
-        test_cases = [
+        test_cases: List[Dict[str, Any]] = [
             {
                 'name': 'authority_module_functionality',
                 'query': 'Should we proceed with experimental treatment?',
@@ -101,15 +218,17 @@ class TMAValidationExperiment:
         results = []
         for case in test_cases:
             result = tma_system.process_with_tma(case['query'])
+            coherence = result['integration_validation']['coherence_score']
+            response_length = len(result['interface_mediation']['practical_response'])
             
             # Validate Authority Module
             authority_valid = len(result['authority_principles']['foundational_guidance']) > 0
             
             # Validate Interface Module  
-            interface_valid = len(result['interface_mediation']['practical_response']) > 20
+            interface_valid = response_length > 20
             
             # Validate Integration Module
-            integration_valid = result['integration_validation']['coherence_score'] >= case.get('expected_coherence_threshold', 0.5)
+            integration_valid = coherence >= case.get('expected_coherence_threshold', 0.5)
             
             case_result = {
                 'case': case['name'],
@@ -117,32 +236,31 @@ class TMAValidationExperiment:
                 'interface_valid': interface_valid,
                 'integration_valid': integration_valid,
                 'overall_success': authority_valid and interface_valid and integration_valid,
-                'coherence_score': result['integration_validation']['coherence_score'],
-                'response_length': len(result['interface_mediation']['practical_response'])
+                'coherence_score': coherence,
+                'response_length': response_length
             }
             
             results.append(case_result)
-            print(f"  ✅ {case['name']}: {'PASS' if case_result['overall_success'] else 'FAIL'} "
-                  f"(coherence: {case_result['coherence_score']:.3f})")
+            self._log(f"  ✅ {case['name']}: {'PASS' if case_result['overall_success'] else 'FAIL'} "
+                  f"(coherence: {coherence:.3f})")
         
-        success_rate = sum(r['overall_success'] for r in results) / len(results)
+        success_rate = sum(1 for r in results if r['overall_success']) / len(results)
         
         return {
             'test_cases': results,
             'success_rate': success_rate,
-            'average_coherence': statistics.mean(r['coherence_score'] for r in results),
+            'average_coherence': statistics.fmean(r['coherence_score'] for r in results),
             'validation': 'PASS' if success_rate >= 0.8 else 'FAIL'
         }
     
     def test_coherence_measurement(self) -> Dict[str, Any]:
         """Test quantitative measurement of integration coherence"""
-        print("\n📊 Testing Coherence Measurement...")
+        self._log("\n📊 Testing Coherence Measurement...")
         
-        principles = self._create_financial_principles()
-        tma_system = TMAArchitecture(principles, "Financial Compliance Testing")
+        tma_system = self.financial_system
         
         # Test scenarios with expected coherence ranges
-        test_scenarios = [
+        test_scenarios: List[Dict[str, Any]] = [
             {
                 'query': 'Approve high-risk investment strategy',
                 'expected_range': (0.4, 0.7),  # Lower coherence due to risk conflicts
@@ -163,9 +281,11 @@ class TMAValidationExperiment:
         coherence_results = []
         for scenario in test_scenarios:
             result = tma_system.process_with_tma(scenario['query'])
-            coherence = result['integration_validation']['coherence_score']
+            integration = result['integration_validation']
+            coherence = integration['coherence_score']
+            low, high = scenario['expected_range']
             
-            within_expected = scenario['expected_range'][0] <= coherence <= scenario['expected_range'][1]
+            within_expected = low <= coherence <= high
             
             coherence_result = {
                 'scenario': scenario['scenario'],
@@ -173,35 +293,35 @@ class TMAValidationExperiment:
                 'measured_coherence': coherence,
                 'expected_range': scenario['expected_range'],
                 'within_expected': within_expected,
-                'integration_quality': result['integration_validation']['integration_quality']
+                'integration_quality': integration['integration_quality']
             }
             
             coherence_results.append(coherence_result)
-            print(f"  📈 {scenario['scenario']}: {coherence:.3f} "
+            self._log(f"  📈 {scenario['scenario']}: {coherence:.3f} "
                   f"{'✅' if within_expected else '❌'} {scenario['expected_range']}")
         
         # Test coherence consistency across multiple runs
-        consistency_test = tma_system.process_with_tma("Consistent test query")
-        coherence_values = []
-        for _ in range(5):
+        coherence_values = np.empty(5, dtype=np.float64)
+        for i in range(5):
             result = tma_system.process_with_tma("Consistent test query")
-            coherence_values.append(result['integration_validation']['coherence_score'])
+            coherence_values[i] = result['integration_validation']['coherence_score']
         
-        coherence_std = statistics.stdev(coherence_values)
+        _, coherence_std = _mean_std(coherence_values)
+        measurement_passed = all(r['within_expected'] for r in coherence_results)
         
         return {
             'scenario_tests': coherence_results,
             'consistency_test': {
-                'coherence_values': coherence_values,
+                'coherence_values': coherence_values.tolist(),
                 'standard_deviation': coherence_std,
                 'consistent': coherence_std < 0.1  # Low variance indicates consistency
             },
-            'measurement_validation': 'PASS' if all(r['within_expected'] for r in coherence_results) else 'FAIL'
+            'measurement_validation': 'PASS' if measurement_passed else 'FAIL'
         }
     
     def test_multi_stakeholder_principles(self) -> Dict[str, Any]:
         """Test multi-stakeholder principle integration and weighting"""
-        print("\n👥 Testing Multi-Stakeholder Principles...")
+        self._log("\n👥 Testing Multi-Stakeholder Principles...")
         
         # Educational AI with multiple stakeholders
         education_principles = [
@@ -231,7 +351,7 @@ class TMAValidationExperiment:
         education_tma = TMAArchitecture(education_principles, "Educational AI System")
         
         # Test queries that should activate different stakeholder weightings
-        stakeholder_tests = [
+        stakeholder_tests: List[Dict[str, Any]] = [
             {
                 'query': 'Grade student assignment with potential plagiarism',
                 'expected_primary_principle': 'academic_integrity',
@@ -270,10 +390,10 @@ class TMAValidationExperiment:
             }
             
             stakeholder_results.append(stakeholder_result)
-            print(f"  🎯 {test['expected_primary_principle']}: {'✅' if expected_activated else '❌'} "
+            self._log(f"  🎯 {test['expected_primary_principle']}: {'✅' if expected_activated else '❌'} "
                   f"({len(activated_principles)} principles activated)")
         
-        activation_rate = sum(r['correctly_activated'] for r in stakeholder_results) / len(stakeholder_results)
+        activation_rate = sum(1 for r in stakeholder_results if r['correctly_activated']) / len(stakeholder_results)
         
         return {
             'stakeholder_tests': stakeholder_results,
@@ -283,104 +403,116 @@ class TMAValidationExperiment:
     
     def test_domain_applications(self) -> Dict[str, Any]:
         """Test TMA across different application domains"""
-        print("\n🏥 Testing Domain Applications...")
+        self._log("\n🏥 Testing Domain Applications...")
         
         domains = {
-            'medical': self._create_medical_system(),
-            'financial': self._create_financial_system(), 
-            'educational': self._create_educational_system()
+            'medical': self.medical_system,
+            'financial': self.financial_system,
+            'educational': self.educational_system
         }
         
         domain_results = {}
         
         for domain_name, system in domains.items():
-            print(f"  🔬 Testing {domain_name} domain...")
+            self._log(f"  🔬 Testing {domain_name} domain...")
             
             test_query = f"Complex {domain_name} decision requiring multiple considerations"
             result = system.process_with_tma(test_query)
+            coherence = result['integration_validation']['coherence_score']
+            response_length = len(result['interface_mediation']['practical_response'])
+            domain_functional = coherence >= 0.6 and response_length > 20
             
             domain_result = {
                 'system_purpose': system.system_purpose,
                 'principle_count': len(system.authority.principles),
-                'coherence_score': result['integration_validation']['coherence_score'],
-                'response_generated': len(result['interface_mediation']['practical_response']) > 0,
+                'coherence_score': coherence,
+                'response_generated': response_length > 0,
                 'constraints_applied': len(result['authority_principles'].get('constraint_requirements', {})) > 0,
-                'domain_functional': (
-                    result['integration_validation']['coherence_score'] >= 0.6 and
-                    len(result['interface_mediation']['practical_response']) > 20
-                )
+                'domain_functional': domain_functional
             }
             
             domain_results[domain_name] = domain_result
-            print(f"    ✅ {domain_name}: coherence={domain_result['coherence_score']:.3f}, "
-                  f"functional={'YES' if domain_result['domain_functional'] else 'NO'}")
+            self._log(f"    ✅ {domain_name}: coherence={coherence:.3f}, "
+                  f"functional={'YES' if domain_functional else 'NO'}")
         
         functional_domains = sum(1 for r in domain_results.values() if r['domain_functional'])
+        domain_success_rate = functional_domains / len(domains)
         
         return {
             'domain_results': domain_results,
             'functional_domains': functional_domains,
             'total_domains': len(domains),
-            'domain_success_rate': functional_domains / len(domains),
+            'domain_success_rate': domain_success_rate,
             'cross_domain_validation': 'PASS' if functional_domains >= 2 else 'FAIL'
         }
     
     def test_performance_metrics(self) -> Dict[str, Any]:
         """Test system performance and efficiency metrics"""
-        print("\n⚡ Testing Performance Metrics...")
-        
-        test_system = self._create_medical_system()
-        
-        # Performance test scenarios
-        performance_tests = []
-        
-        # Response time test
-        start_time = time.time()
-        for i in range(10):
-            result = test_system.process_with_tma(f"Performance test query {i}")
-        avg_response_time = (time.time() - start_time) / 10
-        
-        # Memory efficiency test (simplified)
-        import sys
-        initial_size = sys.getsizeof(test_system)
+        self._log("\n⚡ Testing Performance Metrics...")
+        
+        test_system = self.medical_system
+        
+        # Query strings are built up front so the measured regions only cover processing
+        response_queries = [f"Performance test query {i}" for i in range(10)]
+        memory_queries = [f"Memory test query {i}" for i in range(20)]
+        
+        # Response time test: per-query latency, so tail behaviour is visible
+        latencies = np.empty(len(response_queries), dtype=np.float64)
+        for i, query in enumerate(response_queries):
+            start_time = time.perf_counter_ns()
+            test_system.process_with_tma(query)
+            latencies[i] = (time.perf_counter_ns() - start_time) / 1e9
+        avg_response_time = float(latencies.mean())
+        p50, p95, p99 = np.percentile(latencies, [50, 95, 99]).tolist()
+        
+        # Memory efficiency test: net allocations retained across queries
+        # Leave any tracing the caller already started running
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        before = tracemalloc.take_snapshot()
         
         # Process multiple queries
-        for i in range(20):
-            test_system.process_with_tma(f"Memory test query {i}")
+        for query in memory_queries:
+            test_system.process_with_tma(query)
         
-        final_size = sys.getsizeof(test_system)
-        memory_growth = final_size - initial_size
+        after = tracemalloc.take_snapshot()
+        if started_tracing:
+            tracemalloc.stop()
+        memory_growth = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
         
         # Coherence stability test
-        coherence_scores = []
+        coherence_scores = np.empty(15, dtype=np.float64)
         for i in range(15):
             result = test_system.process_with_tma("Stability test query")
-            coherence_scores.append(result['integration_validation']['coherence_score'])
+            coherence_scores[i] = result['integration_validation']['coherence_score']
         
-        coherence_stability = statistics.stdev(coherence_scores)
+        coherence_mean, coherence_stability = _mean_std(coherence_scores)
         
         performance_metrics = {
             'average_response_time': avg_response_time,
-            'memory_growth_per_query': memory_growth / 20,
+            'response_time_percentiles': {'p50': p50, 'p95': p95, 'p99': p99},
+            'memory_growth_per_query': memory_growth / len(memory_queries),
             'coherence_stability': coherence_stability,
-            'coherence_mean': statistics.mean(coherence_scores),
+            'coherence_mean': coherence_mean,
             'performance_acceptable': (
                 avg_response_time < 1.0 and  # Under 1 second
                 coherence_stability < 0.1    # Low variance
             )
         }
         
-        print(f"  ⏱️  Avg Response Time: {avg_response_time:.3f}s")
-        print(f"  🧠 Memory Growth: {memory_growth} bytes over 20 queries")
-        print(f"  📊 Coherence Stability: {coherence_stability:.3f} (std dev)")
+        self._log(f"  ⏱️  Avg Response Time: {avg_response_time:.3f}s "
+                  f"(p50 {p50 * 1e3:.2f}ms, p95 {p95 * 1e3:.2f}ms, p99 {p99 * 1e3:.2f}ms)")
+        self._log(f"  🧠 Memory Growth: {memory_growth} bytes over {len(memory_queries)} queries")
+        self._log(f"  📊 Coherence Stability: {coherence_stability:.3f} (std dev)")
         
         return performance_metrics
     
     def test_transparency_validation(self) -> Dict[str, Any]:
         """Test transparency and explainability features"""
-        print("\n🔍 Testing Transparency Validation...")
+        self._log("\n🔍 Testing Transparency Validation...")
         
-        test_system = self._create_financial_system()
+        test_system = self.financial_system
         
         # Test decision explanation functionality
         test_query = "Approve unusual trading pattern"
@@ -414,9 +546,9 @@ class TMAValidationExperiment:
             'transparency_validation': 'PASS' if explanation_complete and audit_complete else 'FAIL'
         }
         
-        print(f"  📋 Explanation Complete: {'✅' if explanation_complete else '❌'}")
-        print(f"  📝 Audit Trail Complete: {'✅' if audit_complete else '❌'}")
-        print(f"  🔒 Constraints Visible: {'✅' if constraint_transparency else '❌'}")
+        self._log(f"  📋 Explanation Complete: {'✅' if explanation_complete else '❌'}")
+        self._log(f"  📝 Audit Trail Complete: {'✅' if audit_complete else '❌'}")
+        self._log(f"  🔒 Constraints Visible: {'✅' if constraint_transparency else '❌'}")
         
         return transparency_result
     
@@ -472,13 +604,16 @@ class TMAValidationExperiment:
             )
         ]
     
-    def _create_medical_system(self) -> TMAArchitecture:
+    @functools.cached_property
+    def medical_system(self) -> TMAArchitecture:
         return TMAArchitecture(self._create_medical_principles(), "Medical AI System")
     
-    def _create_financial_system(self) -> TMAArchitecture:
+    @functools.cached_property
+    def financial_system(self) -> TMAArchitecture:
         return TMAArchitecture(self._create_financial_principles(), "Financial AI System")
     
-    def _create_educational_system(self) -> TMAArchitecture:
+    @functools.cached_property
+    def educational_system(self) -> TMAArchitecture:
         principles = [
             DesignPrinciple(
                 name="learning_support",
@@ -497,89 +632,86 @@ class TMAValidationExperiment:
         ]
         return TMAArchitecture(principles, "Educational AI System")
     
+    def invalidate_caches(self) -> None:
+        """Drop the shared domain systems so the next test builds fresh ones"""
+        for name in ('medical_system', 'financial_system', 'educational_system'):
+            self.__dict__.pop(name, None)
+    
+    @staticmethod
+    def _phase_success_metric(result: Dict[str, Any]) -> Optional[float]:
+        """A phase's contribution to the overall success rate, if it has one"""
+        if 'success_rate' in result:
+            return float(result['success_rate'])
+        if 'validation' in result:
+            return 1.0 if result['validation'] == 'PASS' else 0.0
+        return None
+    
     def _calculate_overall_success_rate(self) -> float:
         """Calculate overall success rate across all tests"""
-        success_metrics = []
-        
-        for key, result in self.results.items():
-            if isinstance(result, dict) and 'success_rate' in result:
-                success_metrics.append(result['success_rate'])
-            elif isinstance(result, dict) and 'validation' in result:
-                success_metrics.append(1.0 if result['validation'] == 'PASS' else 0.0)
-        
-        return statistics.mean(success_metrics) if success_metrics else 0.0
+        return statistics.fmean(self._success_metrics) if self._success_metrics else 0.0
     
-    def _generate_validation_report(self):
-        """Generate comprehensive validation report"""
+    async def _generate_validation_report(self) -> None:
+        """Generate comprehensive validation report
+        
+        The JSON report and markdown summary are written from worker threads
+        concurrently, so slow disks don't serialize the two writes.
+        """
+        self.output_dir.mkdir(parents=True, exist_ok=True)
         report_path = self.output_dir / "tma_validation_report.json"
+        summary_path = self.output_dir / "validation_summary.md"
+        
+        def write_report() -> None:
+            report_path.write_bytes(_dumps_report(self.results))
         
-        with open(report_path, 'w') as f:
-            json.dump(self.results, f, indent=2, default=str)
+        def write_summary_file() -> None:
+            with open(summary_path, 'w') as f:
+                f.write(self._generate_markdown_summary())
         
         # Generate summary report
-        summary_path = self.output_dir / "validation_summary.md"
-        with open(summary_path, 'w') as f:
-            f.write(self._generate_markdown_summary())
+        # (run_in_executor rather than asyncio.to_thread, which needs Python 3.9)
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            loop.run_in_executor(None, write_report),
+            loop.run_in_executor(None, write_summary_file),
+        )
         
         print(f"\n📄 Detailed report saved to: {report_path}")
         print(f"📋 Summary report saved to: {summary_path}")
     
     def _generate_markdown_summary(self) -> str:
         """Generate markdown summary of validation results"""
-        return f"""# TMA-SRTA Validation Report
-
-Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-## Executive Summary
-
-**Overall Success Rate**: {self.results['experiment_metadata']['success_rate']:.1%}
-**Total Execution Time**: {self.results['experiment_metadata']['execution_time']:.2f} seconds
-**Total Test Cases**: {self.results['experiment_metadata']['total_tests']}
-
-## Validation Results
-
-### 1. Structural Integration
-- **Success Rate**: {self.results['structural_integration']['success_rate']:.1%}
-- **Average Coherence**: {self.results['structural_integration']['average_coherence']:.3f}
-- **Status**: {self.results['structural_integration']['validation']}
-
-### 2. Coherence Measurement  
-- **Measurement Validation**: {self.results['coherence_measurement']['measurement_validation']}
-- **Consistency Test**: {'PASS' if self.results['coherence_measurement']['consistency_test']['consistent'] else 'FAIL'}
-
-### 3. Multi-Stakeholder Principles
-- **Activation Rate**: {self.results['multi_stakeholder']['principle_activation_rate']:.1%}
-- **Status**: {self.results['multi_stakeholder']['multi_stakeholder_validation']}
-
-### 4. Domain Applications
-- **Functional Domains**: {self.results['domain_applications']['functional_domains']}/{self.results['domain_applications']['total_domains']}
-- **Success Rate**: {self.results['domain_applications']['domain_success_rate']:.1%}
-- **Status**: {self.results['domain_applications']['cross_domain_validation']}
-
-### 5. Performance Metrics
-- **Average Response Time**: {self.results['performance_metrics']['average_response_time']:.3f}s
-- **Performance Acceptable**: {'YES' if self.results['performance_metrics']['performance_acceptable'] else 'NO'}
-
-### 6. Transparency Validation
-- **Transparency Score**: {self.results['transparency_validation']['transparency_score']:.1%}
-- **Status**: {self.results['transparency_validation']['transparency_validation']}
-
-## Conclusions
-
-The TMA-SRTA architecture successfully demonstrates:
-
-1. ✅ **Structural Integration**: All three modules work together coherently
-2. ✅ **Quantitative Measurement**: Coherence can be reliably measured
-3. ✅ **Multi-Stakeholder Support**: Multiple stakeholder perspectives are integrated
-4. ✅ **Cross-Domain Applicability**: Architecture works across different domains
-5. ✅ **Performance Efficiency**: Acceptable response times and stability
-6. ✅ **Transparency**: Complete decision explanation and audit trails
-
-**This represents the first empirical validation of computational four-cause design theory implementation.**
-"""
-
+        r = self.results
+        meta = r['experiment_metadata']
+        structural = r['structural_integration']
+        coherence = r['coherence_measurement']
+        stakeholder = r['multi_stakeholder']
+        domains = r['domain_applications']
+        performance = r['performance_metrics']
+        transparency = r['transparency_validation']
+        
+        return _SUMMARY_TEMPLATE.substitute(
+            generated=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            success_rate=f"{meta['success_rate']:.1%}",
+            execution_time=f"{meta['execution_time']:.2f}",
+            total_tests=meta['total_tests'],
+            structural_success_rate=f"{structural['success_rate']:.1%}",
+            structural_coherence=f"{structural['average_coherence']:.3f}",
+            structural_status=structural['validation'],
+            measurement_status=coherence['measurement_validation'],
+            consistency_status='PASS' if coherence['consistency_test']['consistent'] else 'FAIL',
+            activation_rate=f"{stakeholder['principle_activation_rate']:.1%}",
+            stakeholder_status=stakeholder['multi_stakeholder_validation'],
+            functional_domains=domains['functional_domains'],
+            total_domains=domains['total_domains'],
+            domain_success_rate=f"{domains['domain_success_rate']:.1%}",
+            domain_status=domains['cross_domain_validation'],
+            response_time=f"{performance['average_response_time']:.3f}",
+            performance_status='YES' if performance['performance_acceptable'] else 'NO',
+            transparency_score=f"{transparency['transparency_score']:.1%}",
+            transparency_status=transparency['transparency_validation'],
+        )
 
-def main():
+def main() -> Dict[str, Any]:
     """Run the complete TMA validation experiment"""
     experiment = TMAValidationExperiment()
     results = experiment.run_complete_validation()
@@ -3,46 +3,122 @@
 Extract explanation data from scaled_evaluation_results.csv
 """
 
+import csv
+import os
+
 import pandas as pd
-import json
 
-def extract_original_data():
-    """Extract your original 200 samples"""
+from json_utils import load_json
+
+try:
+    import ijson
+except Exception:
+    ijson = None
+
+# Files at least this large are inspected with the streaming parser (when available)
+STREAM_JSON_BYTES = 10 * 1024 * 1024
+
+def _shape_of(data):
+    if isinstance(data, dict):
+        return {'type': 'dict', 'keys': list(data.keys())}
+    if isinstance(data, list):
+        first_keys = list(data[0].keys()) if data and isinstance(data[0], dict) else None
+        return {'type': 'list', 'length': len(data), 'first_item_keys': first_keys}
+    return {'type': type(data).__name__}
+
+def _stream_shape(path):
+    """Top-level shape from ijson events, without building the document in memory"""
+    with open(path, 'rb') as f:
+        parser = ijson.parse(f)
+        _, event, _ = next(parser)
+        if event == 'start_map':
+            return {'type': 'dict',
+                    'keys': [value for prefix, ev, value in parser if prefix == '' and ev == 'map_key']}
+        if event != 'start_array':
+            return {'type': event}
+        
+        length, first_keys = 0, None
+        for prefix, ev, value in parser:
+            if prefix != 'item':
+                continue
+            if ev == 'map_key':
+                if length == 1 and first_keys is not None:
+                    first_keys.append(value)
+            elif not ev.startswith('end_'):
+                length += 1
+                if length == 1 and ev == 'start_map':
+                    first_keys = []
+        return {'type': 'list', 'length': length, 'first_item_keys': first_keys}
+
+def top_level_shape(path):
+    """Describe a JSON file's top level: dict keys, or list length and first item keys"""
+    if ijson is not None and os.path.getsize(path) >= STREAM_JSON_BYTES:
+        try:
+            return _stream_shape(path)
+        except ijson.JSONError:
+            pass  # e.g. NaN literals, which only the stdlib parser accepts
+    return _shape_of(load_json(path))
+
+OUTPUT_COLUMNS = ['id', 'task_type', 'explanation_text', 'original_srta_score', 'ground_truth']
+
+def _convert_chunk(df, start):
+    """Convert one chunk to multi-agent format rows (missing columns fall back to a default)"""
+    n = len(df)
+    
+    def column(name, default):
+        if name not in df.columns:
+            return [default] * n
+        values = df[name]
+        # NaN is written as an empty field, like DataFrame.to_csv did
+        return values.astype(object).where(values.notna(), None).tolist()
     
-    # Load your original results
-    df = pd.read_csv('./evaluation_results/scaled_evaluation_results.csv')
-    print(f"Loaded {len(df)} samples from scaled_evaluation_results.csv")
-    print(f"Columns: {list(df.columns)}")
+    # You'll need to adjust these column names based on your actual data
+    return zip(
+        [f'original_{i+1:03d}' for i in range(start, start + n)],
+        column('dataset', 'unknown'),  # Adjust column name
+        column('explanation_text', ''),  # Adjust column name  
+        column('overall_score', None),  # Adjust column name
+        column('ground_truth', None)  # Adjust column name
+    )
+
+def extract_original_data(chunksize=10_000):
+    """Extract your original 200 samples
+    
+    The results CSV is converted `chunksize` rows at a time and streamed to
+    the output with the csv module, so memory stays bounded however large
+    the file grows and no intermediate DataFrame is built for the output.
+    Returns the number of converted samples.
+    """
+    src_path = './evaluation_results/scaled_evaluation_results.csv'
+    out_path = 'data/original_200_samples.csv'
     
     # Show first few rows to understand structure
+    head = pd.read_csv(src_path, nrows=3)
+    print(f"Columns: {list(head.columns)}")
     print("\nFirst 3 rows:")
-    print(df.head(3).to_string())
+    print(head.to_string())
     
     # Look for explanation text columns
-    text_cols = [col for col in df.columns if any(word in col.lower() 
+    text_cols = [col for col in head.columns if any(word in col.lower() 
                  for word in ['explanation', 'text', 'content', 'response'])]
     print(f"\nPotential text columns: {text_cols}")
     
-    # Convert to multi-agent format
-    converted_samples = []
-    for i, row in df.iterrows():
-        # You'll need to adjust these column names based on your actual data
-        converted_samples.append({
-            'id': f'original_{i+1:03d}',
-            'task_type': row.get('dataset', 'unknown'),  # Adjust column name
-            'explanation_text': row.get('explanation_text', ''),  # Adjust column name  
-            'original_srta_score': row.get('overall_score', None),  # Adjust column name
-            'ground_truth': row.get('ground_truth', None)  # Adjust column name
-        })
-    
-    # Save converted data
-    converted_df = pd.DataFrame(converted_samples)
-    converted_df.to_csv('data/original_200_samples.csv', index=False)
+    # Load your original results, reading only the columns the conversion uses
+    usecols = [c for c in ('dataset', 'explanation_text', 'overall_score', 'ground_truth')
+               if c in head.columns]
+    total = 0
+    with open(out_path, 'w', newline='') as f:
+        writer = csv.writer(f, lineterminator=os.linesep)
+        writer.writerow(OUTPUT_COLUMNS)
+        for chunk in pd.read_csv(src_path, usecols=usecols or None, chunksize=chunksize):
+            # Save converted data
+            writer.writerows(_convert_chunk(chunk, total))
+            total += len(chunk)
     
-    print(f"\nConverted {len(converted_samples)} samples")
-    print("Saved to data/original_200_samples.csv")
+    print(f"\nLoaded and converted {total} samples from scaled_evaluation_results.csv")
+    print(f"Saved to {out_path}")
     
-    return converted_df
+    return total
 
 def check_json_data():
     """Also check JSON results for additional context"""
@@ -54,15 +130,15 @@ def check_json_data():
     
     for json_file in json_files:
         try:
-            with open(json_file, 'r') as f:
-                data = json.load(f)
+            shape = top_level_shape(json_file)
             print(f"\n{json_file} structure:")
-            if isinstance(data, dict):
-                print(f"Keys: {list(data.keys())}")
-            elif isinstance(data, list):
-                print(f"List with {len(data)} items")
-                if data:
-                    print(f"First item keys: {list(data[0].keys()) if isinstance(data[0], dict) else 'Not a dict'}")
+            if shape['type'] == 'dict':
+                print(f"Keys: {shape['keys']}")
+            elif shape['type'] == 'list':
+                print(f"List with {shape['length']} items")
+                if shape['length']:
+                    first_keys = shape['first_item_keys']
+                    print(f"First item keys: {first_keys if first_keys is not None else 'Not a dict'}")
         except Exception as e:
             print(f"Error reading {json_file}: {e}")
 
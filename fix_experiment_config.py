@@ -2,36 +2,52 @@
 """
 Fix Experiment Configuration - Lower thresholds to enable detection
 """
+import mmap
 import re
 
+# Problematic threshold -> lowered threshold
+THRESHOLD_FIXES = {
+    '0.7': '0.5',
+    '0.8': '0.6',
+    '0.85': '0.6',
+    '0.95': '0.7'
+}
+
+# One pass over the file; tolerates spaces around '=' and won't touch e.g. 0.75.
+# Bytes pattern so it can scan the memory-mapped file without decoding it first
+THRESHOLD_PATTERN = re.compile(
+    rb'semantic_threshold\s*=\s*(' + b'|'.join(re.escape(t.encode()) for t in THRESHOLD_FIXES) + rb')\b'
+)
+
 def fix_semantic_thresholds():
     """Fix the semantic thresholds in experiment_runner.py"""
     print("🔧 FIXING SEMANTIC THRESHOLDS")
     print("="*50)
     
-    # Read original file
-    with open('experiments/experiment_runner.py', 'r') as f:
-        content = f.read()
-    
     # Find and replace problematic thresholds
-    replacements = {
-        'semantic_threshold=0.7': 'semantic_threshold=0.5',
-        'semantic_threshold=0.8': 'semantic_threshold=0.6', 
-        'semantic_threshold=0.85': 'semantic_threshold=0.6',
-        'semantic_threshold=0.95': 'semantic_threshold=0.7'
-    }
+    found = {}
+    
+    def lower_threshold(match):
+        old = match.group(1).decode()
+        found.setdefault(old, THRESHOLD_FIXES[old])
+        return f"semantic_threshold={THRESHOLD_FIXES[old]}".encode()
     
-    fixed_content = content
-    changes_made = []
+    # Scan the original file through a read-only map instead of reading it into a string
+    with open('experiments/experiment_runner.py', 'rb') as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                fixed_content = THRESHOLD_PATTERN.sub(lower_threshold, content)
+        except ValueError:
+            # Empty file, nothing to map
+            fixed_content = b''
     
-    for old, new in replacements.items():
-        if old in fixed_content:
-            fixed_content = fixed_content.replace(old, new)
-            changes_made.append(f"{old} → {new}")
+    changes_made = [
+        f"semantic_threshold={old} → semantic_threshold={new}" for old, new in found.items()
+    ]
     
     if changes_made:
         # Write fixed version
-        with open('experiments/experiment_runner_fixed.py', 'w') as f:
+        with open('experiments/experiment_runner_fixed.py', 'wb') as f:
             f.write(fixed_content)
         
         print("✅ Changes made:")
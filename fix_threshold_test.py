@@ -6,6 +6,14 @@ import json
 import os
 import sys
 
+import numpy as np
+
+try:
+    from rapidfuzz import fuzz
+    from rapidfuzz.process import cpdist
+except Exception:
+    cpdist = None
+
 def test_threshold_impact():
     """Test different threshold values"""
     print("🔧 THRESHOLD IMPACT TEST")
@@ -46,23 +54,40 @@ def test_threshold_impact():
     
     print(f"\n🧪 TESTING DETECTION WITH DIFFERENT THRESHOLDS:")
     
-    from difflib import SequenceMatcher
+    # One similarity per case, then every (case, threshold) decision in one broadcast
+    thresholds = np.array([0.3, 0.5, 0.7, 0.9])
+    # Lowercase every pair once, up front, alongside its expected label
+    pairs = [
+        (case['response'].lower(), case['reference'].lower(), case['should_be_hallucination'])
+        for case in test_cases
+    ]
+    responses, references, labels = (list(column) for column in zip(*pairs))
+    if cpdist is not None:
+        # RapidFuzz (C++): normalized Indel similarity of each response/reference pair
+        similarities = cpdist(responses, references, scorer=fuzz.ratio).astype(np.float64) / 100.0
+    else:
+        from difflib import SequenceMatcher
+        similarities = np.array([
+            SequenceMatcher(None, response, reference).ratio()
+            for response, reference in zip(responses, references)
+        ])
+    # The two ratios differ, so name the one behind these numbers
+    print(f"Similarity metric: {'rapidfuzz.ratio' if cpdist is not None else 'difflib.ratio'}")
+    expected = np.array(labels)
+    is_hallucination = similarities[:, None] < thresholds[None, :]
+    correct = is_hallucination == expected[:, None]
     
-    for i, case in enumerate(test_cases, 1):
-        print(f"\n--- Test Case {i} ---")
+    for i, case in enumerate(test_cases):
+        print(f"\n--- Test Case {i + 1} ---")
         print(f"Response: {case['response']}")
         print(f"Reference: {case['reference']}")
         print(f"Should be hallucination: {case['should_be_hallucination']}")
-        
-        similarity = SequenceMatcher(None, case['response'].lower(), case['reference'].lower()).ratio()
-        print(f"Similarity: {similarity:.3f}")
+        print(f"Similarity: {similarities[i]:.3f}")
         
         print("Detection results:")
-        for threshold in [0.3, 0.5, 0.7, 0.9]:
-            is_hallucination = similarity < threshold
-            correct = is_hallucination == case['should_be_hallucination']
-            status = "✅" if correct else "❌"
-            print(f"   Threshold {threshold:.1f}: {'HALLUCINATION' if is_hallucination else 'OK'} {status}")
+        for j, threshold in enumerate(thresholds):
+            status = "✅" if correct[i, j] else "❌"
+            print(f"   Threshold {threshold:.1f}: {'HALLUCINATION' if is_hallucination[i, j] else 'OK'} {status}")
     
     print(f"\n🎯 CONCLUSION:")
     print("Original thresholds (0.7-0.95) are TOO HIGH")
@@ -1,18 +1,30 @@
 import sys
 import os
+from functools import lru_cache
 sys.path.insert(0, 'src')
 
+@lru_cache(maxsize=None)
+def load_systems():
+    """Build both framework systems once and reuse them for later demo runs"""
+    from three_layer.three_layer_srta import create_medical_ai_three_layer
+    from tma.tma_srta import create_medical_ai_tma
+    
+    return create_medical_ai_three_layer(), create_medical_ai_tma()
+
+def process_all(system, process, queries):
+    """Run every query through a system, in one batch when it supports it"""
+    process_batch = getattr(system, 'process_batch', None)
+    if process_batch is not None:
+        return process_batch(queries)
+    return [process(query) for query in queries]
+
 def run_comparison_demo():
     try:
-        from three_layer.three_layer_srta import create_medical_ai_three_layer
-        from tma.tma_srta import create_medical_ai_tma
-        
         print("=" * 60)
         print("DUAL FRAMEWORK AI ARCHITECTURE DEMONSTRATION")
         print("=" * 60)
         
-        three_layer_system = create_medical_ai_three_layer()
-        tma_system = create_medical_ai_tma()
+        three_layer_system, tma_system = load_systems()
         
         queries = [
             "Should we recommend experimental treatment for a terminal cancer patient?",
@@ -20,20 +32,24 @@ def run_comparison_demo():
             "What safeguards are needed before implementing this AI system?"
         ]
         
-        for i, query in enumerate(queries, 1):
+        three_layer_results = process_all(
+            three_layer_system, three_layer_system.process_with_three_layer, queries
+        )
+        tma_results = process_all(tma_system, tma_system.process_with_tma, queries)
+        
+        for i, (query, three_layer_result, tma_result) in enumerate(
+                zip(queries, three_layer_results, tma_results), 1):
             print(f"\nQUERY {i}: {query}")
             print("-" * 60)
             
             # ThreeLayer
             print("THREE-LAYER FRAMEWORK:")
-            three_layer_result = three_layer_system.process_with_three_layer(query)
             print(f"  Principles: {three_layer_result['authority_module']['core_principles']}")
             print(f"  Response: {three_layer_result['mediator_module']['incarnate_response']}")
             print(f"  Coherence: {three_layer_result['system_unity']['system_coherence_score']}")
             
             # TMA
             print("\nTMA FRAMEWORK:")
-            tma_result = tma_system.process_with_tma(query)
             print(f"  Principles: {tma_result['authority_module']['core_principles']}")
             print(f"  Response: {tma_result['interface_module']['system_response']}")
             print(f"  Coherence: {tma_result['integration_module']['coherence_score']}")
@@ -7,71 +7,96 @@ import pandas as pd
 import numpy as np
 from scipy import stats
 
+try:
+    import pyarrow
+except Exception:
+    pyarrow = None
+
+# PyArrow's multithreaded CSV reader when available; columns keep NumPy dtypes
+CSV_ENGINE = 'pyarrow' if pyarrow is not None else 'c'
+
 def analyze_comparison():
     # Load multi-agent results
-    ma_results = pd.read_csv('outputs/full_200_sample_results.csv')
+    ma_results = pd.read_csv('outputs/full_200_sample_results.csv', engine=CSV_ENGINE, usecols=[
+        'task_type', 'consensus_overall', 'principle_overall', 'expression_overall', 'audit_overall'
+    ])
+    # Only a handful of task types; integer codes make the per-task groupby cheap
+    ma_results['task_type'] = ma_results['task_type'].astype('category')
     
     # Load original data for comparison
-    original_df = pd.read_csv('./evaluation_results/scaled_evaluation_results.csv')
+    original_df = pd.read_csv('./evaluation_results/scaled_evaluation_results.csv',
+                              engine=CSV_ENGINE, usecols=['total_score'])
     
     print("=== COMPARATIVE ANALYSIS: ADDRESSING PEER REVIEW CONCERNS ===")
     
+    # Summary statistics for each score column in one call
+    orig_stats = original_df['total_score'].agg(['var', 'min', 'max'])
+    ma_stats = ma_results['consensus_overall'].agg(['var', 'min', 'max'])
+    
     # 1. Variance Analysis
-    original_variance = original_df['total_score'].var()
-    ma_variance = ma_results['consensus_overall'].var()
+    original_variance = orig_stats['var']
+    ma_variance = ma_stats['var']
+    variance_improvement = ma_variance / original_variance
     
     print(f"\n1. VARIANCE IMPROVEMENT:")
     print(f"   Original SRTA Variance: {original_variance:.6f}")
     print(f"   Multi-Agent Variance:   {ma_variance:.6f}")
-    print(f"   Improvement Factor:     {ma_variance/original_variance:.1f}x")
+    print(f"   Improvement Factor:     {variance_improvement:.1f}x")
     
     # 2. Score Range Analysis
-    orig_range = original_df['total_score'].max() - original_df['total_score'].min()
-    ma_range = ma_results['consensus_overall'].max() - ma_results['consensus_overall'].min()
+    orig_range = orig_stats['max'] - orig_stats['min']
+    ma_range = ma_stats['max'] - ma_stats['min']
+    range_improvement = ma_range / orig_range
     
     print(f"\n2. SCORE DIFFERENTIATION:")
     print(f"   Original Range: {orig_range:.2f} points")
     print(f"   Multi-Agent Range: {ma_range:.2f} points")
-    print(f"   Range Improvement: {ma_range/orig_range:.1f}x")
+    print(f"   Range Improvement: {range_improvement:.1f}x")
     
     # 3. Dataset-Specific Analysis
-    cola_scores = ma_results[ma_results['task_type'] == 'CoLA']['consensus_overall']
-    xnli_scores = ma_results[ma_results['task_type'] == 'XNLI']['consensus_overall']
+    by_task = ma_results.groupby('task_type', observed=True)['consensus_overall']
+    task_means = by_task.mean()
+    task_scores = {task: scores.to_numpy() for task, scores in by_task}
+    empty = np.array([], dtype=float)
+    cola_scores = task_scores.get('CoLA', empty)
+    xnli_scores = task_scores.get('XNLI', empty)
+    cola_avg = task_means.get('CoLA', np.nan)
+    xnli_avg = task_means.get('XNLI', np.nan)
     
     print(f"\n3. DATASET DIFFERENTIATION:")
-    print(f"   CoLA Average: {cola_scores.mean():.2f}")
-    print(f"   XNLI Average: {xnli_scores.mean():.2f}")
+    print(f"   CoLA Average: {cola_avg:.2f}")
+    print(f"   XNLI Average: {xnli_avg:.2f}")
     print(f"   Significant Difference: {stats.ttest_ind(cola_scores, xnli_scores).pvalue < 0.05}")
     
     # 4. Agent Agreement Analysis
-    principle_scores = ma_results['principle_overall']
-    expression_scores = ma_results['expression_overall']
-    audit_scores = ma_results['audit_overall']
+    agent_scores = ma_results[['principle_overall', 'expression_overall', 'audit_overall']].to_numpy()
+    corr = np.corrcoef(agent_scores, rowvar=False)
     
-    pe_corr = stats.pearsonr(principle_scores, expression_scores)[0]
-    pa_corr = stats.pearsonr(principle_scores, audit_scores)[0]
-    ea_corr = stats.pearsonr(expression_scores, audit_scores)[0]
+    pe_corr = corr[0, 1]
+    pa_corr = corr[0, 2]
+    ea_corr = corr[1, 2]
+    agent_agreement = (pe_corr + pa_corr + ea_corr) / 3.0
     
     print(f"\n4. MULTI-AGENT COLLABORATION:")
     print(f"   Principle-Expression Correlation: {pe_corr:.3f}")
     print(f"   Principle-Audit Correlation:     {pa_corr:.3f}")
     print(f"   Expression-Audit Correlation:    {ea_corr:.3f}")
-    print(f"   Average Inter-Agent Agreement:   {np.mean([pe_corr, pa_corr, ea_corr]):.3f}")
+    print(f"   Average Inter-Agent Agreement:   {agent_agreement:.3f}")
     
     # 5. Generate Paper Summary
     print(f"\n5. RESEARCH PAPER EVIDENCE:")
-    print(f"   ✅ Solved ±0.07 variance problem with {ma_variance/original_variance:.1f}x improvement")
+    print(f"   ✅ Solved ±0.07 variance problem with {variance_improvement:.1f}x improvement")
     print(f"   ✅ Eliminated individual researcher bias through 3-agent consensus")
     print(f"   ✅ Achieved meaningful score differentiation ({ma_range:.2f} point range)")
     print(f"   ✅ Demonstrated dataset-specific evaluation patterns")
     print(f"   ✅ Established reproducible collaborative framework")
     
     return {
-        'variance_improvement': ma_variance/original_variance,
-        'range_improvement': ma_range/orig_range,
-        'cola_avg': cola_scores.mean(),
-        'xnli_avg': xnli_scores.mean(),
-        'agent_agreement': np.mean([pe_corr, pa_corr, ea_corr])
+        'variance_improvement': variance_improvement,
+        'range_improvement': range_improvement,
+        'cola_avg': cola_avg,
+        'xnli_avg': xnli_avg,
+        'agent_agreement': agent_agreement
     }
 
 if __name__ == "__main__":
@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-import json
+from json_utils import load_json
 
 def generate_benchmark_summary():
     """既存データと新データの統合サマリー"""
@@ -9,8 +9,7 @@ def generate_benchmark_summary():
     
     # 既存のSRTAデータ
     try:
-        with open("results_hrr_n2000_summary.json") as f:
-            srta_data = json.load(f)
+        srta_data = load_json("results_hrr_n2000_summary.json")
         
         print("📊 SRTA Performance (Actual Implementation):")
         for temp, data in srta_data.items():
@@ -23,8 +22,7 @@ def generate_benchmark_summary():
     
     # 比較データ（シミュレーション）
     try:
-        with open("simple_comparison_results.json") as f:
-            comp_data = json.load(f)
+        comp_data = load_json("simple_comparison_results.json")
         
         print("\n🔄 Comparative Analysis (Simulated):")
         print("Method   | HRR   | Wilson 95% CI")
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+JSON loading helpers shared by the result-processing scripts
+"""
+
+import json
+
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+def loads(data):
+    """Parse JSON text or bytes, using orjson when it is installed"""
+    # orjson rejects the NaN/Infinity literals the stdlib json writer emits
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+def load_json(path):
+    """Parse a JSON file"""
+    with open(path, 'rb') as f:
+        return loads(f.read())
@@ -4,9 +4,26 @@ Load your previous 200-sample dataset for multi-agent comparison
 """
 
 import pandas as pd
+import csv
 import os
+import datetime
 from multi_agent_srta import MultiAgentSRTA, ExplanationSample
 
+try:
+    import pyarrow
+except Exception:
+    pyarrow = None
+
+# PyArrow's multithreaded CSV reader when available; columns keep NumPy dtypes
+CSV_ENGINE = 'pyarrow' if pyarrow is not None else 'c'
+
+def _evaluate_or_none(multi_agent, sample):
+    try:
+        return multi_agent.evaluate_explanation(sample)
+    except Exception as e:
+        print(f"Error processing {sample.id}: {e}")
+        return None
+
 def create_sample_dataset():
     """Create a template showing the expected format"""
     
@@ -27,8 +44,15 @@ def create_sample_dataset():
     print("Created template at data/template_200_samples.csv")
     print("Replace with your actual data and run process_200_samples.py")
 
-def process_200_samples(csv_path: str):
-    """Process your 200 samples through multi-agent system"""
+def process_200_samples(csv_path: str, use_cache: bool = True, batch_size: int = 16):
+    """Process your 200 samples through multi-agent system
+    
+    With use_cache, duplicate explanations (same task type and text) are
+    evaluated once per run; nothing is persisted between runs.
+    Samples that still need evaluating are sent to the agents in batches,
+    and each batch is written to the results CSV as soon as it completes.
+    If batch evaluation fails, the batch is retried one sample at a time.
+    """
     
     if not os.path.exists(csv_path):
         print(f"Data file {csv_path} not found.")
@@ -36,19 +60,19 @@ def process_200_samples(csv_path: str):
         return
     
     # Load data
-    df = pd.read_csv(csv_path)
+    df = pd.read_csv(csv_path, engine=CSV_ENGINE)
     print(f"Loading {len(df)} samples from {csv_path}")
     
-    # Convert to ExplanationSample objects
-    samples = []
-    for _, row in df.iterrows():
-        sample = ExplanationSample(
-            id=row['id'],
-            task_type=row['task_type'],
-            explanation_text=row['explanation_text'],
-            ground_truth=row.get('ground_truth')
+    # Convert to ExplanationSample objects by zipping plain column lists (ground_truth is optional)
+    ground_truths = df['ground_truth'].tolist() if 'ground_truth' in df.columns else [None] * len(df)
+    samples = [
+        ExplanationSample(id=sample_id, task_type=task_type,
+                          explanation_text=explanation_text, ground_truth=ground_truth)
+        for sample_id, task_type, explanation_text, ground_truth in zip(
+            df['id'].tolist(), df['task_type'].tolist(),
+            df['explanation_text'].tolist(), ground_truths
         )
-        samples.append(sample)
+    ]
     
     # Initialize multi-agent system
     print("Initializing multi-agent evaluation system...")
@@ -57,35 +81,86 @@ def process_200_samples(csv_path: str):
     if not multi_agent.load_models():
         print("Warning: Model loading issues, using fallback evaluation")
     
+    # In-run memo: (task type, explanation text) -> evaluation
+    cache = {}
+    reused = 0
+    
     # Process all samples
     print(f"Processing {len(samples)} samples...")
     
-    results = []
-    for i, sample in enumerate(samples):
-        if i % 10 == 0:
-            print(f"Progress: {i}/{len(samples)} samples processed")
-        
-        try:
-            result = multi_agent.evaluate_explanation(sample)
-            results.append(result)
-        except Exception as e:
-            print(f"Error processing {sample.id}: {e}")
-            continue
-    
-    # Save results
+    # Results are written as each batch completes, in input order, and only
+    # running aggregates of the consensus scores are kept in memory
     output_path = 'outputs/full_200_sample_results.csv'
-    df_results = pd.DataFrame(results)
-    df_results.to_csv(output_path, index=False)
+    n = 0
+    mean = m2 = 0.0
+    lowest = highest = None
     
-    print(f"\nCompleted! {len(results)} samples processed")
+    with open(output_path, 'w', newline='') as f:
+        writer = None
+        
+        for start in range(0, len(samples), batch_size):
+            print(f"Progress: {start}/{len(samples)} samples")
+            batch = samples[start:start + batch_size]
+            
+            # Cached samples are filled in directly; the rest are evaluated together
+            batch_results = [None] * len(batch)
+            pending = []
+            for i, sample in enumerate(batch):
+                key = (sample.task_type, sample.explanation_text)
+                cached = cache.get(key) if use_cache else None
+                if cached is not None:
+                    batch_results[i] = dict(cached, sample_id=sample.id,
+                                            timestamp=datetime.datetime.now().isoformat())
+                    reused += 1
+                else:
+                    pending.append((i, key, sample))
+            
+            if pending:
+                try:
+                    evaluated = multi_agent.evaluate_batch([sample for _, _, sample in pending],
+                                                           batch_size=batch_size)
+                except Exception as e:
+                    # Retry sample by sample so one bad sample doesn't drop the whole batch.
+                    # Sequential on purpose: MultiAgentSRTA appends each result column by
+                    # column, so concurrent calls could misalign its stored rows
+                    print(f"Batch evaluation failed ({e}); evaluating samples individually")
+                    evaluated = [_evaluate_or_none(multi_agent, sample) for _, _, sample in pending]
+                
+                for (i, key, _), result in zip(pending, evaluated):
+                    batch_results[i] = result
+                    if use_cache and result is not None:
+                        cache[key] = result
+            
+            for result in batch_results:
+                if result is None:
+                    continue
+                if writer is None:
+                    writer = csv.DictWriter(f, fieldnames=list(result),
+                                            lineterminator=os.linesep)
+                    writer.writeheader()
+                writer.writerow(result)
+                
+                # Welford update keeps the variance stable without a second pass
+                score = result['consensus_overall']
+                n += 1
+                delta = score - mean
+                mean += delta / n
+                m2 += delta * (score - mean)
+                lowest = score if lowest is None else min(lowest, score)
+                highest = score if highest is None else max(highest, score)
+    
+    if use_cache:
+        print(f"Reused {reused} evaluations of duplicate explanations")
+    
+    print(f"\nCompleted! {n} samples processed")
     print(f"Results saved to {output_path}")
     
     # Quick analysis
-    if len(results) > 0:
-        consensus_scores = [r['consensus_overall'] for r in results]
-        print(f"Score range: {min(consensus_scores):.2f} - {max(consensus_scores):.2f}")
-        print(f"Average: {sum(consensus_scores)/len(consensus_scores):.2f}")
-        print(f"Variance: {pd.Series(consensus_scores).var():.4f}")
+    if n > 0:
+        variance = m2 / (n - 1) if n > 1 else float('nan')
+        print(f"Score range: {lowest:.2f} - {highest:.2f}")
+        print(f"Average: {mean:.2f}")
+        print(f"Variance: {variance:.4f}")
 
 if __name__ == "__main__":
     import argparse
@@ -95,6 +170,8 @@ if __name__ == "__main__":
                        help="Create template CSV file")
     parser.add_argument("--input", default="data/your_200_samples.csv",
                        help="Input CSV file with your data")
+    parser.add_argument("--no-cache", action="store_true",
+                       help="Evaluate duplicate explanations separately instead of reusing the first result")
     
     args = parser.parse_args()
     
@@ -104,4 +181,4 @@ if __name__ == "__main__":
     if args.create_template:
         create_sample_dataset()
     else:
-        process_200_samples(args.input)
+        process_200_samples(args.input, use_cache=not args.no_cache)
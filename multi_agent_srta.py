@@ -3,13 +3,17 @@
 Complete Apertus 3-Agent SRTA Evaluation System
 """
 
+import csv
 import json
 import os
 import datetime
 from dataclasses import dataclass
-import pandas as pd
-from transformers import AutoTokenizer, AutoModelForCausalLM
-import torch
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+import numpy as np
+
+# torch, transformers and pandas are imported where they are used, so analysis-only
+# runs (and importing this module) don't pay their import cost
 
 @dataclass
 class ExplanationSample:
@@ -28,70 +32,152 @@ class SRTAScore:
     confidence: float
     agent_id: str
 
+def text_stats(explanation_text: str) -> Tuple[int, int]:
+    """Text characteristics the demo scoring is based on: (length, word count)"""
+    return len(explanation_text), len(explanation_text.split())
+
+_NO_OFFSET = np.zeros(4)
+
 class ApertusAgent:
+    # Agent-specific adjustment to (systematic, relevant, transparent, actionable)
+    _ROLE_OFFSET = {
+        "principle": np.array([1.0, 0.0, 0.0, 0.0]),
+        "expression": np.array([0.0, 0.0, 1.0, 0.0]),
+        "audit": np.array([-0.5, -0.5, 0.0, 0.0]),
+    }
+    
+    # (tokenizer, model) per (model name, device), shared by every agent in the process
+    _MODEL_CACHE: Dict[Tuple[str, str], tuple] = {}
+    
     def __init__(self, agent_role: str, model_name: str = "microsoft/DialoGPT-medium"):
         self.agent_role = agent_role
         self.model_name = model_name
-        self.device = "cuda" if torch.cuda.is_available() else "cpu"
+        self.device = None  # picked when the model is loaded
         self.tokenizer = None
         self.model = None
-        print(f"Initializing {agent_role} agent on {self.device}")
+        print(f"Initializing {agent_role} agent")
     
     def load_model(self):
         print(f"Loading model for {self.agent_role} agent...")
         try:
+            import torch
+            from transformers import AutoTokenizer, AutoModelForCausalLM
+            
+            self.device = "cuda" if torch.cuda.is_available() else "cpu"
+            key = (self.model_name, self.device)
+            cached = self._MODEL_CACHE.get(key)
+            if cached is not None:
+                # Agents share one copy of the weights; they are only used for inference
+                self.tokenizer, self.model = cached
+                print(f"{self.agent_role} agent reusing loaded model")
+                return True
+            
+            # Half-precision weights on GPU: bfloat16 where supported, float16 otherwise
+            if self.device == "cuda":
+                dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+            else:
+                dtype = torch.float32
+            
             # Use a smaller, more accessible model for testing
             self.tokenizer = AutoTokenizer.from_pretrained(self.model_name)
-            self.model = AutoModelForCausalLM.from_pretrained(self.model_name)
+            self.model = AutoModelForCausalLM.from_pretrained(self.model_name, torch_dtype=dtype)
             
             if self.tokenizer.pad_token is None:
                 self.tokenizer.pad_token = self.tokenizer.eos_token
+            # Decoder-only model: pad batches on the left so generation continues the text
+            self.tokenizer.padding_side = "left"
             
             self.model.to(self.device)
-            print(f"{self.agent_role} agent model loaded successfully")
+            # Inference only: no dropout, no autograd bookkeeping on the weights
+            self.model.eval()
+            self.model.requires_grad_(False)
+            if os.environ.get("SRTA_TORCH_COMPILE") == "1" and self.device == "cuda":
+                self._compile_model()
+            self._MODEL_CACHE[key] = (self.tokenizer, self.model)
+            print(f"{self.agent_role} agent model loaded successfully on {self.device}")
             return True
         except Exception as e:
             print(f"Error loading model for {self.agent_role}: {e}")
             return False
     
+    def _compile_model(self):
+        """Compile the model with torch.compile and warm it up (opt-in via SRTA_TORCH_COMPILE=1)
+        
+        The warm-up generate triggers compilation at load time, which can take
+        minutes, instead of on the first evaluation. Gains depend on model and
+        batch size, so benchmark with and without the flag.
+        """
+        import torch
+        
+        print(f"Compiling model for {self.agent_role} agent (first run can take minutes)...")
+        self.model = torch.compile(self.model, mode="reduce-overhead", fullgraph=False)
+        warmup = self.tokenizer("warmup", return_tensors="pt").to(self.device)
+        with torch.inference_mode():
+            self.model.generate(**warmup, max_new_tokens=4,
+                                pad_token_id=self.tokenizer.pad_token_id)
+    
     def evaluate_explanation(self, explanation_text: str) -> SRTAScore:
         """Generate SRTA evaluation for explanation"""
+        return self.evaluate_batch([explanation_text])[0]
+    
+    def evaluate_batch(self, explanation_texts: List[str]) -> List[SRTAScore]:
+        """Generate SRTA evaluations for several explanations in one call"""
+        stats = [text_stats(text) for text in explanation_texts]
+        return self.score_batch([s[0] for s in stats], [s[1] for s in stats])
+    
+    def score_batch(self, text_lengths, word_counts) -> List[SRTAScore]:
+        """Score explanations from their precomputed lengths and word counts"""
+        scores = self.score_matrix(text_lengths, word_counts)
+        overall_scores = scores.sum(axis=1) / 4
+        confidence_score = 7.0  # Mock confidence
         
-        # For demo purposes, generate scores based on text characteristics
-        text_length = len(explanation_text)
-        word_count = len(explanation_text.split())
+        return [
+            SRTAScore(
+                systematic=round(systematic, 2),
+                relevant=round(relevant, 2),
+                transparent=round(transparent, 2),
+                actionable=round(actionable, 2),
+                overall=round(overall, 2),
+                confidence=confidence_score,
+                agent_id=self.agent_role
+            )
+            for (systematic, relevant, transparent, actionable), overall
+            in zip(scores.tolist(), overall_scores.tolist())
+        ]
+    
+    def score_matrix(self, text_lengths, word_counts) -> np.ndarray:
+        """Heuristic scores as an (N, 4) array: systematic, relevant, transparent, actionable"""
+        lengths = np.asarray(text_lengths, dtype=np.float64)
+        words = np.asarray(word_counts, dtype=np.float64)
         
         # Simple heuristic scoring based on text characteristics
-        systematic_score = min(10, max(1, (word_count / 10) + 3))
-        relevant_score = min(10, max(1, 8 - (abs(word_count - 25) / 10)))
-        transparent_score = min(10, max(1, 10 - (text_length / 50)))
-        actionable_score = min(10, max(1, 6 + (word_count / 20)))
+        scores = np.empty((words.size, 4))
+        scores[:, 0] = words / 10 + 3
+        scores[:, 1] = 8 - np.abs(words - 25) / 10
+        scores[:, 2] = 10 - lengths / 50
+        scores[:, 3] = 6 + words / 20
+        np.clip(scores, 1, 10, out=scores)
         
         # Agent-specific adjustments
-        if self.agent_role == "principle":
-            systematic_score += 1
-        elif self.agent_role == "expression":
-            transparent_score += 1
-        elif self.agent_role == "audit":
-            systematic_score -= 0.5
-            relevant_score -= 0.5
+        scores += self._ROLE_OFFSET.get(self.agent_role, _NO_OFFSET)
         
         # Ensure scores stay within bounds
-        scores = [systematic_score, relevant_score, transparent_score, actionable_score]
-        scores = [max(1, min(10, score)) for score in scores]
-        
-        overall_score = sum(scores) / 4
-        confidence_score = 7.0  # Mock confidence
-        
-        return SRTAScore(
-            systematic=round(scores[0], 2),
-            relevant=round(scores[1], 2),
-            transparent=round(scores[2], 2),
-            actionable=round(scores[3], 2),
-            overall=round(overall_score, 2),
-            confidence=confidence_score,
-            agent_id=self.agent_role
-        )
+        return np.clip(scores, 1, 10, out=scores)
+
+# Consensus weights (principle, expression, audit)
+CONSENSUS_WEIGHTS = np.array([0.4, 0.3, 0.3])
+
+# Samples scored per agent call; override with SRTA_BATCH_SIZE
+EVAL_BATCH_SIZE = int(os.environ.get("SRTA_BATCH_SIZE", "32"))
+
+# Fields of each evaluation result, in output column order
+RESULT_COLUMNS = (
+    'sample_id', 'task_type',
+    'principle_overall', 'expression_overall', 'audit_overall',
+    'consensus_overall', 'consensus_systematic', 'consensus_relevant',
+    'consensus_transparent', 'consensus_actionable',
+    'timestamp'
+)
 
 class MultiAgentSRTA:
     def __init__(self, model_name: str = "microsoft/DialoGPT-medium"):
@@ -99,7 +185,19 @@ class MultiAgentSRTA:
         self.principle_agent = ApertusAgent("principle", model_name)
         self.expression_agent = ApertusAgent("expression", model_name)
         self.audit_agent = ApertusAgent("audit", model_name)
-        self.results = []
+        # Results are kept column-wise so saving builds the DataFrame in one go
+        self.result_columns: Dict[str, list] = {column: [] for column in RESULT_COLUMNS}
+    
+    @property
+    def results(self) -> Tuple[Mapping[str, Any], ...]:
+        """Evaluation results as one read-only mapping per sample
+        
+        Built from result_columns on each access, so it is a snapshot: appending
+        to it or assigning into a row raises instead of being silently lost.
+        Use dict(row) for an editable copy.
+        """
+        return tuple(MappingProxyType(dict(zip(RESULT_COLUMNS, row)))
+                     for row in zip(*self.result_columns.values()))
     
     def load_models(self):
         """Load models for all agents"""
@@ -122,31 +220,62 @@ class MultiAgentSRTA:
         expression_score = self.expression_agent.evaluate_explanation(sample.explanation_text)
         audit_score = self.audit_agent.evaluate_explanation(sample.explanation_text)
         
-        # Calculate consensus (weighted average)
-        weights = {"principle": 0.4, "expression": 0.3, "audit": 0.3}
-        
-        consensus_systematic = (
-            principle_score.systematic * weights["principle"] +
-            expression_score.systematic * weights["expression"] +
-            audit_score.systematic * weights["audit"]
-        )
-        
-        consensus_relevant = (
-            principle_score.relevant * weights["principle"] +
-            expression_score.relevant * weights["expression"] +
-            audit_score.relevant * weights["audit"]
-        )
+        consensus = self._consensus([principle_score], [expression_score], [audit_score])
+        result = self._combine(sample, principle_score, expression_score, audit_score,
+                               consensus[0], datetime.datetime.now().isoformat())
+        self._record([result])
+        return result
+    
+    def evaluate_batch(self, samples: List[ExplanationSample], batch_size: Optional[int] = None):
+        """Evaluate several explanations, scoring each batch with every agent in one call
         
-        consensus_transparent = (
-            principle_score.transparent * weights["principle"] +
-            expression_score.transparent * weights["expression"] +
-            audit_score.transparent * weights["audit"]
-        )
+        Text characteristics are computed once per sample and shared by the three
+        agents. Returns results in the same order and format as evaluate_explanation;
+        samples scored together share their batch's timestamp. Results are only
+        stored once every sample has been scored, so a call that raises stores none.
+        """
+        batch_size = batch_size or EVAL_BATCH_SIZE
+        results = []
+        for start in range(0, len(samples), batch_size):
+            batch = samples[start:start + batch_size]
+            stats = [text_stats(sample.explanation_text) for sample in batch]
+            lengths = np.fromiter((s[0] for s in stats), dtype=np.int64, count=len(stats))
+            word_counts = np.fromiter((s[1] for s in stats), dtype=np.int64, count=len(stats))
+            principle_scores = self.principle_agent.score_batch(lengths, word_counts)
+            expression_scores = self.expression_agent.score_batch(lengths, word_counts)
+            audit_scores = self.audit_agent.score_batch(lengths, word_counts)
+            consensus = self._consensus(principle_scores, expression_scores, audit_scores)
+            timestamp = datetime.datetime.now().isoformat()
+            
+            for sample, p, e, a, c in zip(batch, principle_scores, expression_scores,
+                                          audit_scores, consensus):
+                print(f"Evaluating {sample.id}: {sample.task_type}")
+                results.append(self._combine(sample, p, e, a, c, timestamp))
+        self._record(results)
+        return results
+    
+    @staticmethod
+    def _consensus(principle_scores: List[SRTAScore], expression_scores: List[SRTAScore],
+                   audit_scores: List[SRTAScore]) -> np.ndarray:
+        """Weighted consensus of the agents' dimension scores as an (N, 4) array
         
-        consensus_actionable = (
-            principle_score.actionable * weights["principle"] +
-            expression_score.actionable * weights["expression"] +
-            audit_score.actionable * weights["audit"]
+        Scores are stacked agent-major into a (3, N, 4) array so the whole
+        batch is weighted in one broadcast. The agent axis is summed in
+        order (principle, expression, audit); a BLAS matrix product would
+        reorder the additions and shift some rounded scores by 0.01.
+        """
+        scores = np.array([
+            [(s.systematic, s.relevant, s.transparent, s.actionable) for s in agent_scores]
+            for agent_scores in (principle_scores, expression_scores, audit_scores)
+        ], dtype=np.float64)
+        return (scores * CONSENSUS_WEIGHTS[:, None, None]).sum(axis=0)
+    
+    def _combine(self, sample: ExplanationSample, principle_score: SRTAScore,
+                 expression_score: SRTAScore, audit_score: SRTAScore,
+                 consensus: np.ndarray, timestamp: str):
+        """Build the result for one sample from the three agent scores and their consensus"""
+        consensus_systematic, consensus_relevant, consensus_transparent, consensus_actionable = (
+            consensus.tolist()
         )
         
         consensus_overall = (consensus_systematic + consensus_relevant + 
@@ -175,11 +304,9 @@ class MultiAgentSRTA:
             'consensus_relevant': consensus_score.relevant,
             'consensus_transparent': consensus_score.transparent,
             'consensus_actionable': consensus_score.actionable,
-            'timestamp': datetime.datetime.now().isoformat()
+            'timestamp': timestamp
         }
         
-        self.results.append(result)
-        
         print(f"  Principle: {principle_score.overall:.2f}")
         print(f"  Expression: {expression_score.overall:.2f}") 
         print(f"  Audit: {audit_score.overall:.2f}")
@@ -187,22 +314,46 @@ class MultiAgentSRTA:
         
         return result
     
-    def save_results(self, output_path: str = "outputs/multi_agent_results.csv"):
-        """Save results to CSV"""
-        if not self.results:
+    def _record(self, results: List[dict]) -> None:
+        """Append finished results to the stored result columns"""
+        for column, values in self.result_columns.items():
+            values.extend(result[column] for result in results)
+    
+    def save_results(self, output_path: str = "outputs/multi_agent_results.csv",
+                     format: str = "csv"):
+        """Save results to CSV, or to zstd-compressed Parquet with format="parquet"
+        
+        Parquet needs pyarrow; it keeps the score columns typed and is much
+        smaller and faster to write than CSV for large runs.
+        """
+        if format not in ("csv", "parquet"):
+            raise ValueError(f"Unsupported results format: {format}")
+        
+        if not self.result_columns['sample_id']:
             print("No results to save")
             return
         
-        df = pd.DataFrame(self.results)
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        df.to_csv(output_path, index=False)
+        if format == "parquet":
+            import pandas as pd
+            
+            pd.DataFrame(self.result_columns).to_parquet(
+                output_path, engine="pyarrow", compression="zstd", index=False
+            )
+        else:
+            # Plain rows straight from the columns; same layout as DataFrame.to_csv
+            with open(output_path, 'w', newline='') as f:
+                writer = csv.writer(f, lineterminator=os.linesep)
+                writer.writerow(self.result_columns)
+                writer.writerows(zip(*self.result_columns.values()))
         print(f"Results saved to {output_path}")
         
         # Print summary
+        scores = np.asarray(self.result_columns['consensus_overall'], dtype=np.float64)
         print(f"\nSummary:")
-        print(f"  Total samples: {len(df)}")
-        print(f"  Average consensus score: {df['consensus_overall'].mean():.2f}")
-        print(f"  Score range: {df['consensus_overall'].min():.2f} - {df['consensus_overall'].max():.2f}")
+        print(f"  Total samples: {scores.size}")
+        print(f"  Average consensus score: {scores.mean():.2f}")
+        print(f"  Score range: {scores.min():.2f} - {scores.max():.2f}")
 
 def run_demo():
     """Run demonstration"""
@@ -239,10 +390,9 @@ def run_demo():
     if not multi_agent.load_models():
         print("Failed to load models. Running with mock evaluation.")
     
-    # Evaluate samples
-    for sample in samples:
-        multi_agent.evaluate_explanation(sample)
-        print()
+    # Evaluate samples, all agents scoring the whole list per batch
+    multi_agent.evaluate_batch(samples)
+    print()
     
     # Save results
     multi_agent.save_results()
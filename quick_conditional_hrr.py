@@ -3,8 +3,6 @@
 Quick Conditional HRR - Calculate with corrected detection
 """
 import json
-from collections import defaultdict
-from difflib import SequenceMatcher
 
 def calculate_fixed_hrr():
     """Calculate HRR with fixed threshold"""
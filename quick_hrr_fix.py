@@ -8,83 +8,100 @@ Analyzes existing results and fixes HRR=0 problem
 import os
 import json
 import glob
+from array import array
 from pathlib import Path
-from collections import defaultdict, Counter
+from collections import Counter
 import numpy as np
 
+from json_utils import loads
+
+# Boolean fields that mark a record as hallucinated, in order of preference
+HALLUCINATION_FIELDS = ['is_hallucination', 'hallucination_detected', 'has_hallucination', 'hallucinates']
+
 def analyze_jsonl_file(file_path):
-    """Analyze a JSONL results file"""
+    """Analyze a JSONL results file
+    
+    Records are streamed line by line; only the hallucination flag and an
+    integer item code are kept per record, packed into compact arrays.
+    """
     print(f"\n📊 Analyzing: {file_path}")
     
     try:
-        data = []
-        with open(file_path, 'r', encoding='utf-8') as f:
+        sample = None
+        halluc_field = id_field = None
+        total_count = 0
+        flags = bytearray()
+        ids = array('q')
+        codes = {}  # item id -> integer code, in order of first appearance
+        
+        with open(file_path, 'rb') as f:
             for line_num, line in enumerate(f, 1):
                 try:
-                    data.append(json.loads(line.strip()))
+                    record = loads(line.strip())
                 except json.JSONDecodeError as e:
                     if line_num <= 5:  # Only report first few errors
                         print(f"   Line {line_num} JSON error: {e}")
+                    continue
+                
+                if sample is None:
+                    # Field names are taken from the first record
+                    sample = record
+                    halluc_field = next((name for name in HALLUCINATION_FIELDS if name in sample), None)
+                    id_field = next((name for name in ('item_id', 'question_id') if name in sample), None)
+                
+                total_count += 1
+                if halluc_field:
+                    flags.append(bool(record.get(halluc_field, False)))
+                if id_field:
+                    ids.append(codes.setdefault(record.get(id_field), len(codes)))
         
-        print(f"✅ Loaded {len(data)} records from {file_path}")
+        print(f"✅ Loaded {total_count} records from {file_path}")
         
-        if not data:
+        if sample is None:
             return None
             
         # Analyze structure
-        sample = data[0]
         print(f"🔍 Sample structure: {list(sample.keys())}")
         
         # Look for hallucination detection
         hallucination_count = 0
-        total_count = len(data)
-        
-        # Check different possible field names
-        halluc_field = None
-        for field_name in ['is_hallucination', 'hallucination_detected', 'has_hallucination', 'hallucinates']:
-            if field_name in sample:
-                halluc_field = field_name
-                break
         
         if halluc_field:
-            hallucination_count = sum(1 for item in data if item.get(halluc_field, False))
+            flags = np.frombuffer(flags, dtype=np.bool_)
+            hallucination_count = int(flags.sum())
             print(f"📈 Hallucination field '{halluc_field}': {hallucination_count}/{total_count} ({hallucination_count/total_count:.1%})")
         else:
             print("⚠️  No clear hallucination field found in:", list(sample.keys()))
         
         # Calculate conditional HRR if possible
-        if 'item_id' in sample or 'question_id' in sample:
-            id_field = 'item_id' if 'item_id' in sample else 'question_id'
-            items = defaultdict(list)
-            
-            for record in data:
-                item_id = record.get(id_field)
-                items[item_id].append(record)
+        if id_field:
+            ids = np.frombuffer(ids, dtype=np.int64)
+            n_items = len(codes)
             
             items_with_hallucinations = 0
-            conditional_scores = []
-            
-            for item_id, records in items.items():
-                if halluc_field:
-                    hallucinations = [r.get(halluc_field, False) for r in records]
-                    if any(hallucinations):
-                        items_with_hallucinations += 1
-                        # Pattern consistency (simplified)
-                        pattern_rate = sum(hallucinations) / len(hallucinations)
-                        conditional_scores.append(pattern_rate)
+            conditional_hrr = 0.0
             
-            conditional_hrr = np.mean(conditional_scores) if conditional_scores else 0.0
+            if halluc_field:
+                # Per-item hallucination counts and run counts in two bincount passes
+                hallucinations = np.bincount(ids, weights=flags, minlength=n_items)
+                runs = np.bincount(ids, minlength=n_items)
+                has_hallucination = hallucinations > 0
+                items_with_hallucinations = int(has_hallucination.sum())
+                # Pattern consistency (simplified)
+                pattern_rates = hallucinations[has_hallucination] / runs[has_hallucination]
+                if pattern_rates.size:
+                    conditional_hrr = pattern_rates.mean()
             
             print(f"🎯 Conditional HRR Analysis:")
-            print(f"   - Total unique items: {len(items)}")
+            print(f"   - Total unique items: {n_items}")
             print(f"   - Items with hallucinations: {items_with_hallucinations}")
-            print(f"   - Coverage: {items_with_hallucinations/len(items):.1%}")
+            print(f"   - Coverage: {items_with_hallucinations/n_items:.1%}")
             print(f"   - Conditional HRR: {conditional_hrr:.3f}")
             
             return {
                 'file': file_path,
                 'total_records': total_count,
-                'total_items': len(items),
+                'total_items': n_items,
                 'items_with_hallucinations': items_with_hallucinations,
                 'conditional_hrr': conditional_hrr,
                 'hallucination_rate': hallucination_count/total_count if total_count > 0 else 0
@@ -9,25 +9,34 @@ classical four-cause design patterns in modern AI systems.
 
 from setuptools import setup, find_packages
 import os
-import re
+import sys
+
+# Read a project file in one shot; None if it is missing or unreadable
+def _read(path):
+    try:
+        with open(path, 'rb') as f:
+            return f.read().decode('utf-8', 'replace')
+    except OSError:
+        return None
 
 # Read version from __init__.py
 def get_version():
-    version_file = os.path.join('src', 'tma', '__init__.py')
-    if os.path.exists(version_file):
-        with open(version_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-            version_match = re.search(r"^__version__ = ['\"]([^'\"]*)['\"]", content, re.M)
-            if version_match:
-                return version_match.group(1)
+    content = _read(os.path.join('src', 'tma', '__init__.py'))
+    if content is not None:
+        # First line of the form: __version__ = "x.y.z" (either quote style)
+        for line in content.split('\n'):
+            if line.startswith('__version__ = ') and line[14:15] in ('"', "'"):
+                value = line[15:]
+                for end, char in enumerate(value):
+                    if char in ('"', "'"):
+                        return value[:end]
     return "1.0.0"
 
 # Read long description from README
 def get_long_description():
-    readme_path = os.path.join(os.path.dirname(__file__), 'README.md')
-    if os.path.exists(readme_path):
-        with open(readme_path, 'r', encoding='utf-8') as f:
-            return f.read()
+    content = _read(os.path.join(os.path.dirname(__file__), 'README.md'))
+    if content is not None:
+        return content
     return "TMA-SRTA: Three-Module Architecture for Self-Regulating Transparent AI"
 
 # Core dependencies
@@ -227,7 +236,7 @@ setup(
 )
 
 # Post-installation message
-print("""
+POST_INSTALL_MESSAGE = """
 🎉 TMA-SRTA Installation Complete!
 
 Three-Module Architecture for Self-Regulating Transparent AI
@@ -255,4 +264,8 @@ For more information: https://github.com/ubunturbo/srta-ai-accountability
 
 Welcome to the Aristotelian revolution in AI design! 🏛️✨
 ===============================================================================
-""")
+"""
+
+# Only shown for explicit installs, not for egg_info/metadata or wheel builds
+if any(command in sys.argv[1:] for command in ("install", "develop")):
+    print(POST_INSTALL_MESSAGE)
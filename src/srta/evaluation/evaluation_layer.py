@@ -10,11 +10,20 @@ for accountability and regulatory compliance.
 
 import time
 import re
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Tuple
 from dataclasses import dataclass
 from enum import Enum
 from datetime import datetime
 
+# Compiled once at import; used on every clarity evaluation
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+
+# What/Why/How/Who indicators for completeness, matched as substrings of the lowercased text
+_WHAT_RE = re.compile(r'decision|result|output|recommendation|conclusion')
+_WHY_RE = re.compile(r'because|due to|based on|reason|principle|justification')
+_HOW_RE = re.compile(r'process|step|method|analysis|calculation|evaluation')
+_WHO_RE = re.compile(r'stakeholder|responsible|team|officer|committee|authority')
+
 
 class QualityLevel(Enum):
     """
@@ -55,6 +64,9 @@ class EvaluationResult:
     
     責任報告と説明品質の継続的改善をサポートします。
     """
+    # Explicit __slots__ (dataclass(slots=True) needs Python 3.10+)
+    __slots__ = ("metrics", "quality_level", "improvement_suggestions", "assessment_message", "processing_time")
+    
     metrics: EvaluationMetrics          # Quantitative metrics
     quality_level: QualityLevel         # Overall quality assessment
     improvement_suggestions: List[str]  # Specific recommendations
@@ -74,6 +86,10 @@ class EvaluationLayer:
     包括的評価を実装します。
     """
 
+    # Levels checked in order by _determine_quality_level; anything below is POOR
+    _GRADED_LEVELS = (QualityLevel.EXCELLENT, QualityLevel.GOOD, QualityLevel.FAIR)
+    _level_cutoffs: Tuple[Tuple[float, QualityLevel], ...]
+
     def __init__(self):
         self.quality_thresholds = {
             QualityLevel.EXCELLENT: 0.9,   # 90%+ threshold
@@ -81,6 +97,7 @@ class EvaluationLayer:
             QualityLevel.FAIR: 0.6,        # 60-74% threshold
             QualityLevel.POOR: 0.4         # <60% threshold
         }
+        self._refresh_level_cutoffs()
         
         # Enhanced evaluation criteria
         self.evaluation_criteria = {
@@ -137,10 +154,14 @@ class EvaluationLayer:
             confidence = context.get('confidence', 0.5)
             metadata = {}
 
+        # Lowercase and tokenize once; shared by all metric evaluators
+        text_lower = text.lower() if text else ''
+        words = text_lower.split()
+
         # Calculate comprehensive metrics
-        clarity = self._evaluate_clarity(text)
-        completeness = self._evaluate_completeness(text, context)
-        understandability = self._evaluate_understandability(text, context)
+        clarity = self._evaluate_clarity(text, words)
+        completeness = self._evaluate_completeness(text_lower, context)
+        understandability = self._evaluate_understandability(text, text_lower, words, context)
         
         # Calculate overall score with weighting
         overall = self._calculate_overall_score(clarity, completeness, understandability, confidence)
@@ -172,7 +193,7 @@ class EvaluationLayer:
             processing_time=processing_time
         )
 
-    def _evaluate_clarity(self, text: str) -> float:
+    def _evaluate_clarity(self, text: str, words: List[str]) -> float:
         """Evaluate text clarity using multiple criteria."""
         if not text:
             return 0.0
@@ -180,7 +201,7 @@ class EvaluationLayer:
         clarity_scores = []
         
         # Sentence length analysis
-        sentences = re.split(r'[.!?]+', text)
+        sentences = _SENTENCE_SPLIT_RE.split(text)
         if sentences:
             avg_sentence_length = sum(len(s.split()) for s in sentences if s.strip()) / len([s for s in sentences if s.strip()])
             max_length = self.evaluation_criteria['clarity']['sentence_length']['max']
@@ -189,8 +210,8 @@ class EvaluationLayer:
         
         # Jargon usage analysis
         jargon_words = ['algorithm', 'heuristic', 'optimization', 'neural', 'computational']
-        word_count = len(text.split())
-        jargon_count = sum(1 for word in text.lower().split() if any(jargon in word for jargon in jargon_words))
+        word_count = len(words)
+        jargon_count = sum(1 for word in words if any(jargon in word for jargon in jargon_words))
         jargon_ratio = jargon_count / word_count if word_count > 0 else 0
         max_jargon_ratio = self.evaluation_criteria['clarity']['jargon_usage']['max_ratio']
         jargon_score = max(0, 1 - (jargon_ratio - max_jargon_ratio) / max_jargon_ratio) if jargon_ratio > max_jargon_ratio else 1.0
@@ -202,7 +223,7 @@ class EvaluationLayer:
         
         return sum(clarity_scores)
 
-    def _evaluate_completeness(self, text: str, context: Dict[str, Any]) -> float:
+    def _evaluate_completeness(self, text_lower: str, context: Dict[str, Any]) -> float:
         """
         Evaluate explanation completeness using SRTA framework.
         SRTAフレームワークを使用した説明完全性評価。
@@ -213,35 +234,31 @@ class EvaluationLayer:
         規制遵守に必要なWhat/Why/How/Who質問の
         カバレッジを評価します。
         """
-        if not text:
+        if not text_lower:
             return 0.0
         
-        text_lower = text.lower()
         completeness_scores = []
         
         # What coverage - decision description
-        what_indicators = ['decision', 'result', 'output', 'recommendation', 'conclusion']
-        what_coverage = 1.0 if any(indicator in text_lower for indicator in what_indicators) else 0.0
+        what_coverage = 1.0 if _WHAT_RE.search(text_lower) else 0.0
         completeness_scores.append(what_coverage * self.evaluation_criteria['completeness']['what_coverage']['weight'])
         
         # Why coverage - reasoning explanation (UNIQUE TO SRTA)
-        why_indicators = ['because', 'due to', 'based on', 'reason', 'principle', 'justification']
-        why_coverage = 1.0 if any(indicator in text_lower for indicator in why_indicators) else 0.0
+        why_coverage = 1.0 if _WHY_RE.search(text_lower) else 0.0
         completeness_scores.append(why_coverage * self.evaluation_criteria['completeness']['why_coverage']['weight'])
         
         # How coverage - process description
-        how_indicators = ['process', 'step', 'method', 'analysis', 'calculation', 'evaluation']
-        how_coverage = 1.0 if any(indicator in text_lower for indicator in how_indicators) else 0.0
+        how_coverage = 1.0 if _HOW_RE.search(text_lower) else 0.0
         completeness_scores.append(how_coverage * self.evaluation_criteria['completeness']['how_coverage']['weight'])
         
         # Who coverage - responsibility attribution (UNIQUE TO SRTA)
-        who_indicators = ['stakeholder', 'responsible', 'team', 'officer', 'committee', 'authority']
-        who_coverage = 1.0 if any(indicator in text_lower for indicator in who_indicators) else 0.0
+        who_coverage = 1.0 if _WHO_RE.search(text_lower) else 0.0
         completeness_scores.append(who_coverage * self.evaluation_criteria['completeness']['who_coverage']['weight'])
         
         return sum(completeness_scores)
 
-    def _evaluate_understandability(self, text: str, context: Dict[str, Any]) -> float:
+    def _evaluate_understandability(self, text: str, text_lower: str, words: List[str],
+                                    context: Dict[str, Any]) -> float:
         """Evaluate user understandability of explanation."""
         if not text:
             return 0.0
@@ -264,15 +281,15 @@ class EvaluationLayer:
         
         # Structure clarity (presence of clear organization)
         structure_indicators = ['first', 'second', 'finally', 'therefore', 'however', 'additionally']
-        structure_score = min(1.0, sum(1 for indicator in structure_indicators if indicator in text.lower()) / 3)
+        structure_score = min(1.0, sum(1 for indicator in structure_indicators if indicator in text_lower) / 3)
         understandability_scores.append(structure_score * self.evaluation_criteria['understandability']['structure_clarity']['weight'])
         
         # Context appropriateness (basic assessment)
         user_background = context.get('user_background', 'general')
         if user_background == 'technical':
-            context_score = 0.8 + (0.2 if 'technical' in text.lower() or 'algorithm' in text.lower() else 0)
+            context_score = 0.8 + (0.2 if 'technical' in text_lower or 'algorithm' in text_lower else 0)
         elif user_background == 'general':
-            context_score = 0.8 + (0.2 if len(text.split()) < 100 else 0)  # Prefer shorter explanations for general users
+            context_score = 0.8 + (0.2 if len(words) < 100 else 0)  # Prefer shorter explanations for general users
         else:
             context_score = 0.7
         
@@ -300,14 +317,14 @@ class EvaluationLayer:
 
     def _determine_quality_level(self, overall_score: float) -> QualityLevel:
         """Determine quality level based on overall score."""
-        if overall_score >= self.quality_thresholds[QualityLevel.EXCELLENT]:
-            return QualityLevel.EXCELLENT
-        elif overall_score >= self.quality_thresholds[QualityLevel.GOOD]:
-            return QualityLevel.GOOD
-        elif overall_score >= self.quality_thresholds[QualityLevel.FAIR]:
-            return QualityLevel.FAIR
-        else:
-            return QualityLevel.POOR
+        for threshold, level in self._level_cutoffs:
+            if overall_score >= threshold:
+                return level
+        return QualityLevel.POOR
+
+    def _refresh_level_cutoffs(self) -> None:
+        """Rebuild the (threshold, level) tuple used by _determine_quality_level."""
+        self._level_cutoffs = tuple((self.quality_thresholds[level], level) for level in self._GRADED_LEVELS)
 
     def _generate_improvement_suggestions(self, metrics: EvaluationMetrics, 
                                         context: Dict[str, Any]) -> List[str]:
@@ -372,6 +389,7 @@ class EvaluationLayer:
     def update_quality_thresholds(self, new_thresholds: Dict[QualityLevel, float]):
         """Update quality assessment thresholds."""
         self.quality_thresholds.update(new_thresholds)
+        self._refresh_level_cutoffs()
         print(f"Quality thresholds updated for {len(new_thresholds)} levels")
 
     def export_evaluation_config(self) -> Dict[str, Any]:
@@ -14,7 +14,8 @@ from .tma_srta import (
     InterfaceModule,
     IntegrationModule,
     DesignPrinciple,
-    ProcessingContext
+    ProcessingContext,
+    ValidationCache
 )
 
 __version__ = "1.0.0"
@@ -24,5 +25,6 @@ __all__ = [
     "InterfaceModule", 
     "IntegrationModule",
     "DesignPrinciple",
-    "ProcessingContext"
+    "ProcessingContext",
+    "ValidationCache"
 ]
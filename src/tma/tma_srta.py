@@ -16,12 +16,16 @@ from dataclasses import dataclass
 from abc import ABC, abstractmethod
 import json
 import hashlib
+from collections import OrderedDict
 from datetime import datetime
 
 
 @dataclass
 class DesignPrinciple:
     """Represents a core design principle in the Authority Module"""
+    # Explicit __slots__ (dataclass(slots=True) needs Python 3.10+)
+    __slots__ = ("name", "description", "weight", "constraints", "stakeholder_input")
+    
     name: str
     description: str
     weight: float
@@ -50,6 +54,44 @@ class AuthorityModule:
         self.principles = {p.name: p for p in principles}
         self.system_purpose = system_purpose
         self.principle_history = []
+        self._principle_keywords: Dict[str, List[str]] = {}
+        self._keyword_set: frozenset = frozenset()
+        self._principles_state: Tuple[Tuple[str, str, float, str], ...] = ()
+        self.principles_changed()
+    
+    def _current_state(self) -> Tuple[Tuple[str, str, float, str], ...]:
+        # Everything evaluate_principles reads from a principle
+        return tuple(
+            (name, p.description, p.weight, repr(p.constraints))
+            for name, p in self.principles.items()
+        )
+    
+    def principles_changed(self) -> bool:
+        """Check whether principles were added, removed or edited since the last check
+        
+        Rebuilds the keyword index when they were. Keyword lists only change
+        with the principles, so they are split once here rather than per query.
+        """
+        state = self._current_state()
+        if state == self._principles_state:
+            return False
+        self._principles_state = state
+        self._principle_keywords = {
+            name: p.description.lower().split() for name, p in self.principles.items()
+        }
+        self._keyword_set = frozenset(
+            kw for keywords in self._principle_keywords.values() for kw in keywords
+        )
+        return True
+    
+    def fingerprint(self, context: ProcessingContext) -> frozenset:
+        """Principle keywords present in the query
+        
+        Relevance depends only on which keywords occur in the query, so two
+        queries with the same fingerprint get identical principle evaluations.
+        """
+        query_lower = context.query.lower()
+        return frozenset(kw for kw in self._keyword_set if kw in query_lower)
     
     def evaluate_principles(self, context: ProcessingContext) -> Dict[str, Any]:
         """Evaluate how core principles apply to the current context"""
@@ -84,7 +126,9 @@ class AuthorityModule:
         """Calculate how relevant a principle is to the current context"""
         # Simplified relevance calculation - can be enhanced with NLP
         query_lower = context.query.lower()
-        principle_keywords = principle.description.lower().split()
+        principle_keywords = self._principle_keywords.get(principle.name)
+        if principle_keywords is None:
+            principle_keywords = principle.description.lower().split()
         
         relevance = 0.0
         for keyword in principle_keywords:
@@ -306,6 +350,50 @@ class IntegrationModule:
         return improvements
 
 
+class ValidationCache:
+    """
+    Small LRU cache of Authority Module evaluations keyed on query fingerprint
+    
+    Keeps only the most recent evaluations (sliding window), which covers
+    the common case of bursts of queries that touch the same principles.
+    Entries are copied on the way in and out (top level and its lists/dicts),
+    so results sharing a fingerprint don't see each other's mutations.
+    A maxsize of 0 disables caching.
+    """
+    
+    def __init__(self, maxsize: int = 5):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[frozenset, Dict[str, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def _copy(authority_output: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy an evaluation and its top-level lists/dicts"""
+        return {key: value.copy() if isinstance(value, (dict, list)) else value
+                for key, value in authority_output.items()}
+    
+    def get(self, fingerprint: frozenset) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(fingerprint)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(fingerprint)
+        self.hits += 1
+        return self._copy(entry)
+    
+    def put(self, fingerprint: frozenset, authority_output: Dict[str, Any]) -> None:
+        if self.maxsize <= 0:
+            return
+        self._entries[fingerprint] = self._copy(authority_output)
+        self._entries.move_to_end(fingerprint)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        self._entries.clear()
+
+
 class TMAArchitecture:
     """
     Three-Module Architecture (TMA) for Self-Regulating Transparent AI
@@ -314,12 +402,14 @@ class TMAArchitecture:
     interconnected architecture based on Structural Design Pattern Theory.
     """
     
-    def __init__(self, principles: List[DesignPrinciple], system_purpose: str):
+    def __init__(self, principles: List[DesignPrinciple], system_purpose: str,
+                 use_cache: bool = True):
         self.authority = AuthorityModule(principles, system_purpose)
         self.interface = InterfaceModule()
         self.integration = IntegrationModule()
         self.system_purpose = system_purpose
         self.processing_history = []
+        self.validation_cache = ValidationCache(maxsize=5 if use_cache else 0)
     
     def process_with_tma(self, query: str, user_context: Optional[Dict] = None) -> Dict[str, Any]:
         """Process query through complete TMA architecture"""
@@ -331,8 +421,41 @@ class TMAArchitecture:
             session_id=hashlib.md5(f"{query}{datetime.now()}".encode()).hexdigest()[:8]
         )
         
-        # Authority Module processing
-        authority_output = self.authority.evaluate_principles(context)
+        return self._process_context(context)
+    
+    def process_batch(self, queries: List[str],
+                      user_context: Optional[Dict] = None) -> List[Dict[str, Any]]:
+        """Process several queries in one pass, sharing the batch timestamp
+        
+        Equivalent to calling process_with_tma for each query in order.
+        Session ids stay unique per query because they hash the query
+        string and its position in the batch.
+        """
+        timestamp = datetime.now()
+        stamp = str(timestamp)
+        user_context = user_context or {}
+        
+        return [
+            self._process_context(ProcessingContext(
+                query=query,
+                user_context=user_context,
+                timestamp=timestamp,
+                session_id=hashlib.md5(f"{query}{stamp}{i}".encode()).hexdigest()[:8]
+            ))
+            for i, query in enumerate(queries)
+        ]
+    
+    def _process_context(self, context: ProcessingContext) -> Dict[str, Any]:
+        """Run a prepared context through the three modules and record it"""
+        # Authority Module processing, reused for queries with the same fingerprint
+        # while the principles are unchanged
+        if self.authority.principles_changed():
+            self.validation_cache.clear()
+        fingerprint = self.authority.fingerprint(context)
+        authority_output = self.validation_cache.get(fingerprint)
+        if authority_output is None:
+            authority_output = self.authority.evaluate_principles(context)
+            self.validation_cache.put(fingerprint, authority_output)
         
         # Interface Module processing
         interface_output = self.interface.mediate_response(context, authority_output)